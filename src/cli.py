@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import argparse
+import sys
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
 
 from loguru import logger
 
-from cv_service import run_generation
 from exceptions import CvGeneratorError
 
+# Idiomas aceitos por `-l`, individualmente ou em lista separada por virgulas.
+SUPPORTED_LANGUAGES = ("pt", "en")
+
 
 # Monta o parser da CLI com defaults do projeto e validacao de opcoes aceitas.
 def build_argument_parser() -> argparse.ArgumentParser:
@@ -17,16 +22,16 @@ def build_argument_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "input",
-        nargs="?",
+        nargs="*",
         default=None,
-        help="JSON file with CV data (default defined in config file)",
+        help="JSON file(s) with CV data (default defined in config file); several files are generated in parallel",
     )
     parser.add_argument(
         "-l",
         "--language",
-        choices=["pt", "en"],
+        type=_language_list,
         default=None,
-        help="CV language: pt (Portuguese) or en (English)",
+        help="CV language: pt (Portuguese) or en (English); comma-separated for several, e.g. pt,en",
     )
     parser.add_argument(
         "-o",
@@ -37,25 +42,85 @@ def build_argument_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-c",
         "--config",
-        default=str(Path(__file__).resolve().parents[1] / "config" / "config.json"),
+        default=None,
         help="Configuration file (default: config/config.json in project root)",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Parallel worker processes for multiple PDFs (default: 1 for small batches, CPU count from 8 PDFs)",
+    )
     return parser
 
 
+# Separa `-l pt,en` em idiomas validados, sem repeticoes e na ordem informada.
+def _language_list(raw_value: str) -> list[str]:
+    languages = list(dict.fromkeys(language.strip().lower() for language in raw_value.split(",")))
+    invalid_languages = [language for language in languages if language not in SUPPORTED_LANGUAGES]
+    if invalid_languages:
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: {', '.join(map(repr, invalid_languages))} (choose from {', '.join(SUPPORTED_LANGUAGES)})"
+        )
+    return languages
+
+
+# Converte o valor de `--workers`, recusando zero/negativos ainda no parse dos argumentos.
+def _positive_int(raw_value: str) -> int:
+    try:
+        parsed_value = int(raw_value)
+    except ValueError:
+        parsed_value = 0
+    if parsed_value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {raw_value!r}")
+    return parsed_value
+
+
+# Resolve o config padrao do projeto sob demanda, so quando `-c` nao for informado.
+@cache
+def default_config_file_path() -> Path:
+    return Path(__file__).resolve().parents[1] / "config" / "config.json"
+
+
 # Conduz o fluxo da CLI, convertendo excecoes em codigo de saida adequado para shell/CI.
 def main(argv: list[str] | None = None) -> int:
     parser = build_argument_parser()
     arguments = parser.parse_args(argv)
+    input_files = arguments.input or [None]
+    languages = arguments.language or [None]
+    # Cada combinacao entrada x idioma vira um job; varios jobs seguem pelo lote em um unico processo pai.
+    generation_jobs = [(input_file, language) for input_file in input_files for language in languages]
+    if len(generation_jobs) > 1 and arguments.output:
+        parser.error("--output cannot be used with multiple input files or languages")
 
+    # Importa o pipeline (e o ReportLab) só após o parse: `--help` e erros de argumento saem sem esse custo.
+    from cv_service import GenerationRequest, run_generation, run_generation_batch
+
+    config_file_path = arguments.config or default_config_file_path()
     try:
-        generated_file = run_generation(
-            config_file_path=arguments.config,
-            language=arguments.language,
-            input_file_path=arguments.input,
-            output_file_path=arguments.output,
-        )
+        if len(generation_jobs) == 1:
+            input_file, language = generation_jobs[0]
+            generated_files = [
+                run_generation(
+                    config_file_path=config_file_path,
+                    language=language,
+                    input_file_path=input_file,
+                    output_file_path=arguments.output,
+                )
+            ]
+        else:
+            generated_files = run_generation_batch(
+                config_file_path=config_file_path,
+                generation_requests=[
+                    GenerationRequest(language=language, input_file_path=input_file)
+                    for input_file, language in generation_jobs
+                ],
+                max_workers=arguments.workers,
+            )
     except CvGeneratorError as generation_error:
+        # Em lote, os PDFs que deram certo continuam sendo informados antes do erro.
+        _print_generated_files(getattr(generation_error, "generated_files", ()))
         logger.bind(event="app_failed", step="cli").error(str(generation_error))
         print(f"Error: {generation_error}")
         return 1
@@ -66,9 +131,17 @@ def main(argv: list[str] | None = None) -> int:
         logger.exception("Unhandled exception in CLI")
         return 1
 
-    print(f"✓ CV generated successfully: {generated_file}")
+    _print_generated_files(generated_files)
     return 0
 
 
+# Informa os PDFs gerados no stdout com uma unica escrita, mesmo em lotes grandes.
+def _print_generated_files(generated_files: Iterable[Path]) -> None:
+    # O stdout continua sendo a saida legivel por scripts (`start_mac.sh`, pipes), entao nao e suprimido fora de TTY.
+    success_lines = "".join(f"✓ CV generated successfully: {generated_file}\n" for generated_file in generated_files)
+    if success_lines:
+        sys.stdout.write(success_lines)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
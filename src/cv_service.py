@@ -1,27 +1,54 @@
 # Caso de uso principal que coordena configuracao, leitura de dados e geracao final do PDF.
 from __future__ import annotations
+import os
 import time
 import uuid
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from loguru import logger
 from localization import get_localized_field, sanitize_filename_component
 from validators import validate_cv_data
 from infrastructure.config_loader import AppConfig, load_app_config
-from infrastructure.json_repository import load_json
-from infrastructure.pdf_renderer import CvPdfRenderer
-from exceptions import OutputPathError
-from logging_config import bind_logger_context, configure_logging
+from infrastructure.json_repository import load_resolved_json
+from exceptions import BatchGenerationError, CvGeneratorError, OutputPathError, PdfRenderError
+from logging_config import bind_logger_context, configure_logging, forward_worker_logs
+
+if TYPE_CHECKING:
+    from infrastructure.pdf_renderer import CvPdfRenderer
+
+
+# A partir deste numero de PDFs, sem `max_workers` explicito, o lote usa um worker por CPU.
+PARALLEL_BATCH_MIN_JOBS = 8
+
+# Servicos por config dentro de cada worker do pool, reaproveitando renderizadores entre tarefas do mesmo processo.
+_WORKER_SERVICES: dict[str, "CvGenerationService"] = {}
+# Fila de logs do processo pai, definida pelo initializer de cada worker do pool.
+_WORKER_LOG_QUEUE: Any | None = None
+
+
+# Descreve uma geracao individual dentro de um lote (idioma e caminhos opcionais).
+@dataclass(frozen=True)
+class GenerationRequest:
+    language: str | None = None
+    input_file_path: str | None = None
+    output_file_path: str | None = None
 
 
 # Coordena todo o pipeline de geracao: caminhos, validacao, renderizacao e observabilidade.
 class CvGenerationService:
 
     # Carrega configuracao e inicializa logging para que cada geracao rode com contexto consistente.
-    def __init__(self, config_file_path: str | Path) -> None:
+    def __init__(self, config_file_path: str | Path, *, log_queue: Any | None = None) -> None:
         self.config_file_path = Path(config_file_path).expanduser().resolve()
         self.config: AppConfig = load_app_config(self.config_file_path)
         self.config_directory = self.config_file_path.parent
+        # Renderizadores reaproveitados entre gerações com mesmo idioma, estilos e traduções.
+        self._pdf_renderers: dict[tuple[str, Path, Path], CvPdfRenderer] = {}
+        # Caminhos do config são fixos por serviço; resolvê-los uma vez evita `resolve()` a cada geração.
+        self._resolved_config_paths: dict[str, Path] = {}
 
         logs_directory = self._resolve_config_relative_path(
             self.config.logging.directory
@@ -30,6 +57,7 @@ class CvGenerationService:
             level=self.config.logging.level,
             enabled=self.config.logging.enabled,
             logs_directory=logs_directory,
+            log_queue=log_queue,
         )
 
     # Conduz a geracao ponta a ponta e retorna o caminho absoluto do PDF produzido.
@@ -49,13 +77,10 @@ class CvGenerationService:
         started_at = time.perf_counter()
         file_encoding = self.config.defaults.encoding
 
-        cv_data = load_json(data_file_path, encoding=file_encoding)
-        visual_settings = load_json(visual_settings_path, encoding=file_encoding)
-        translations = load_json(translations_path, encoding=file_encoding)
+        cv_data = load_resolved_json(data_file_path, encoding=file_encoding)
 
         if output_file_path:
             output_path = self._resolve_runtime_path(output_file_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
         else:
             output_path = self._build_output_file_path(
                 cv_data=cv_data,
@@ -73,10 +98,10 @@ class CvGenerationService:
         validate_cv_data(cv_data)
         contextual_logger.bind(event="input_validated", step="validators").info("Input data validated successfully")
 
-        pdf_renderer = CvPdfRenderer(
+        pdf_renderer = self._get_pdf_renderer(
             language=effective_language,
-            translations=translations,
-            visual_settings=visual_settings,
+            visual_settings_path=visual_settings_path,
+            translations_path=translations_path,
         )
 
         generated_pdf_path = pdf_renderer.render_cv(
@@ -94,12 +119,58 @@ class CvGenerationService:
 
         return generated_pdf_path
 
+    # Gera varios PDFs no mesmo processo, reaproveitando stylesheet e formatadores entre documentos.
+    def generate_many(self, generation_requests: Sequence[GenerationRequest]) -> list[Path]:
+        generated_paths: list[Path] = []
+        failures: list[tuple[str, CvGeneratorError]] = []
+        for generation_request in generation_requests:
+            # Uma entrada invalida nao interrompe o lote; as falhas sao reportadas juntas ao final.
+            try:
+                generated_paths.append(self.generate_request(generation_request))
+            except Exception as generation_error:
+                failures.append(_describe_batch_failure(generation_request, generation_error))
+        if failures:
+            raise BatchGenerationError(generated_paths, failures)
+        return generated_paths
+
+    # Executa uma unica entrada de lote com os campos do `GenerationRequest`.
+    def generate_request(self, generation_request: GenerationRequest) -> Path:
+        return self.generate(
+            language=generation_request.language,
+            input_file_path=generation_request.input_file_path,
+            output_file_path=generation_request.output_file_path,
+        )
+
+    # Retorna renderizador em cache ou carrega estilos/traducoes e monta um novo no primeiro uso.
+    def _get_pdf_renderer(
+        self,
+        *,
+        language: str,
+        visual_settings_path: Path,
+        translations_path: Path,
+    ) -> CvPdfRenderer:
+        renderer_key = (language, visual_settings_path, translations_path)
+        pdf_renderer = self._pdf_renderers.get(renderer_key)
+        if pdf_renderer is None:
+            # ReportLab só é importado quando um PDF vai de fato ser montado (entrada já validada).
+            from infrastructure.pdf_renderer import CvPdfRenderer
+
+            file_encoding = self.config.defaults.encoding
+            translations = load_resolved_json(translations_path, encoding=file_encoding)
+            visual_settings = load_resolved_json(visual_settings_path, encoding=file_encoding)
+            pdf_renderer = CvPdfRenderer(
+                language=language,
+                translations=translations,
+                visual_settings=visual_settings,
+            )
+            self._pdf_renderers[renderer_key] = pdf_renderer
+        return pdf_renderer
+
     # Monta nome final do PDF com dados do candidato e impede escrita fora do diretorio configurado.
     def _build_output_file_path(self, *, cv_data: dict[str, Any], language: str) -> Path:
         output_directory = self._resolve_config_relative_path(
             self.config.files.output_dir
         )
-        output_directory.mkdir(parents=True, exist_ok=True)
 
         personal_info = cv_data.get("personal_info", {})
         desired_role = cv_data.get("desired_role", {})
@@ -112,7 +183,7 @@ class CvGenerationService:
         resolved_output_path = candidate_output_path.resolve()
 
         # Garante que componentes do nome não permitam escapar da pasta de saída.
-        if output_directory.resolve() not in resolved_output_path.parents:
+        if output_directory not in resolved_output_path.parents:
             raise OutputPathError("Generated output path escaped output directory")
 
         return resolved_output_path
@@ -141,10 +212,18 @@ class CvGenerationService:
 
     # Resolve caminhos relativos ao diretorio do config, preservando caminhos absolutos.
     def _resolve_config_relative_path(self, raw_path: str | Path) -> Path:
+        path_key = str(raw_path)
+        resolved_path = self._resolved_config_paths.get(path_key)
+        if resolved_path is not None:
+            return resolved_path
+
         candidate_path = Path(raw_path).expanduser()
         if candidate_path.is_absolute():
-            return candidate_path.resolve()
-        return (self.config_directory / candidate_path).resolve()
+            resolved_path = candidate_path.resolve()
+        else:
+            resolved_path = (self.config_directory / candidate_path).resolve()
+        self._resolved_config_paths[path_key] = resolved_path
+        return resolved_path
 
     # Aplica prioridade entre caminho direto e mapeamento por idioma, falhando com erro explicito quando faltar configuracao.
     def _resolve_language_aware_path(
@@ -182,7 +261,93 @@ def run_generation(
         input_file_path=input_file_path,
         output_file_path=output_file_path,
     )
+    # Argumentos no estilo `{}` só são formatados pelo loguru se o nível estiver habilitado.
+    logger.bind(event="app_finished", step="entrypoint").info("Generated file: {}", generated_path)
+    return generated_path
+
+
+# Gera varios CVs em lote; com mais de um worker cada PDF roda em processo separado (CPU-bound no ReportLab).
+# Sem `max_workers`, so lotes com `PARALLEL_BATCH_MIN_JOBS` ou mais PDFs usam o pool.
+def run_generation_batch(
+    *,
+    config_file_path: str | Path,
+    generation_requests: Sequence[GenerationRequest],
+    max_workers: int | None = None,
+) -> list[Path]:
+    if max_workers is None:
+        # Sem `-j`, lotes pequenos (ex.: `-l pt,en`) rodam no próprio processo: criar workers, que reimportam o
+        # ReportLab e remontam estilos, custa mais do que renderizar poucos PDFs em sequência.
+        if len(generation_requests) < PARALLEL_BATCH_MIN_JOBS:
+            max_workers = 1
+        else:
+            max_workers = os.cpu_count() or 1
+    worker_count = min(len(generation_requests), max_workers)
+    # O serviço do pai configura o logging a partir do config antes de qualquer log do lote.
+    service = CvGenerationService(config_file_path=config_file_path)
+    # Lote unitário ou worker único roda no próprio processo, sem custo de criar o pool.
+    if worker_count <= 1:
+        return service.generate_many(generation_requests)
+
+    worker_config_path = str(config_file_path)
+    generated_paths: list[Path] = []
+    failures: list[tuple[str, CvGeneratorError]] = []
+    # Registros dos workers voltam por fila ao pai, que os grava no mesmo console/arquivo de um lote sequencial.
+    with forward_worker_logs() as log_queue, ProcessPoolExecutor(
+        max_workers=worker_count,
+        initializer=_initialize_worker,
+        initargs=(log_queue,),
+    ) as executor:
+        generation_futures = [
+            executor.submit(_generate_in_worker, worker_config_path, generation_request)
+            for generation_request in generation_requests
+        ]
+        for generation_request, generation_future in zip(generation_requests, generation_futures):
+            # Qualquer falha do worker (inclusive pool quebrado) vira falha do item, preservando os PDFs gerados.
+            try:
+                generated_paths.append(generation_future.result())
+            except Exception as generation_error:
+                failures.append(_describe_batch_failure(generation_request, generation_error))
+
+    if failures:
+        raise BatchGenerationError(generated_paths, failures)
+
     logger.bind(event="app_finished", step="entrypoint").info(
-        f"Generated file: {generated_path}"
+        "Generated {} files with {} workers", len(generated_paths), worker_count
     )
-    return generated_path
+    return generated_paths
+
+
+# Guarda no worker a fila de logs criada pelo processo pai.
+def _initialize_worker(log_queue: Any) -> None:
+    global _WORKER_LOG_QUEUE
+    _WORKER_LOG_QUEUE = log_queue
+
+
+# Executa uma geracao dentro de um processo worker do pool.
+def _generate_in_worker(config_file_path: str, generation_request: GenerationRequest) -> Path:
+    service = _WORKER_SERVICES.get(config_file_path)
+    if service is None:
+        # Workers não escrevem logs diretamente: tudo segue pela fila até o processo pai.
+        service = CvGenerationService(config_file_path=config_file_path, log_queue=_WORKER_LOG_QUEUE)
+        _WORKER_SERVICES[config_file_path] = service
+    return service.generate_request(generation_request)
+
+
+# Identifica a entrada de um lote e converte erros inesperados para o dominio antes de agrega-los.
+def _describe_batch_failure(
+    generation_request: GenerationRequest,
+    generation_error: Exception,
+) -> tuple[str, CvGeneratorError]:
+    input_label = generation_request.input_file_path or "default input"
+    # Com `-l pt,en` a mesma entrada aparece uma vez por idioma; o idioma diferencia as falhas.
+    if generation_request.language:
+        input_label = f"{input_label} [{generation_request.language}]"
+    if isinstance(generation_error, CvGeneratorError):
+        return input_label, generation_error
+    # Erro fora do dominio: o traceback fica no log, ja que a CLI so recebe o resumo do lote.
+    logger.bind(event="batch_item_failed", step="cv_service").opt(exception=generation_error).error(
+        "Unexpected failure generating {}", input_label
+    )
+    wrapped_error = PdfRenderError(f"Unexpected failure: {generation_error!r}")
+    wrapped_error.__cause__ = generation_error
+    return input_label, wrapped_error
@@ -1,6 +1,8 @@
 # Hierarquia de excecoes de dominio para diferenciar falhas esperadas de erros genericos.
 from __future__ import annotations
 
+from pathlib import Path
+
 
 # Base para erros controlados da aplicacao, facilitando tratamento centralizado na CLI.
 class CvGeneratorError(Exception):
@@ -45,3 +47,16 @@ class OutputPathError(CvGeneratorError):
 class PdfRenderError(CvGeneratorError):
     # Indica falhas no processo de renderizacao do PDF.
     pass
+
+
+# Agrega as falhas de um lote sem descartar os PDFs que foram gerados com sucesso.
+class BatchGenerationError(CvGeneratorError):
+
+    # Guarda os arquivos gerados e as falhas por entrada para a CLI reportar ambos.
+    def __init__(self, generated_files: list[Path], failures: list[tuple[str, CvGeneratorError]]) -> None:
+        failure_details = "; ".join(f"{input_label}: {error}" for input_label, error in failures)
+        super().__init__(
+            f"{len(failures)} of {len(generated_files) + len(failures)} CV generations failed: {failure_details}"
+        )
+        self.generated_files = generated_files
+        self.failures = failures
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from exceptions import ConfigurationError
+from infrastructure.json_repository import decode_json_bytes
 
 
 # Agrupa caminhos de entrada/saida usados no fluxo de geracao apos validacao.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileSettings:
     data: str
     data_by_language: dict[str, str] | None
@@ -21,14 +24,14 @@ class FileSettings:
 
 
 # Guarda idioma e encoding aplicados quando a CLI nao informa overrides.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DefaultSettings:
     language: str
     encoding: str
 
 
 # Representa nivel, diretorio e estado de habilitacao do logging.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggingSettings:
     enabled: bool
     level: str
@@ -36,36 +39,65 @@ class LoggingSettings:
 
 
 # Objeto raiz imutavel com todas as secoes necessarias para executar a aplicacao.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     files: FileSettings
     defaults: DefaultSettings
     logging: LoggingSettings
 
 
+# Limite de configuracoes mantidas em cache; processos longos com muitos config.json nao crescem sem limite.
+APP_CONFIG_CACHE_SIZE = 16
+
+# Configuracoes ja parseadas por caminho (ordem LRU), validas enquanto mtime/tamanho do arquivo nao mudarem.
+_APP_CONFIG_CACHE: OrderedDict[Path, tuple[tuple[int, int], AppConfig]] = OrderedDict()
+# Servicos podem ser criados em threads diferentes; a reordenacao LRU precisa ser atomica.
+_APP_CONFIG_CACHE_LOCK = threading.Lock()
+
+
 # Le o arquivo de configuracao, valida JSON e devolve configuracao tipada.
 def load_app_config(config_file_path: Path) -> AppConfig:
     resolved_config_path = config_file_path.expanduser().resolve()
 
-    if not resolved_config_path.exists():
-        raise ConfigurationError(f"Configuration file not found: {resolved_config_path}")
+    try:
+        config_file_stat = resolved_config_path.stat()
+    except FileNotFoundError as exc:
+        raise ConfigurationError(f"Configuration file not found: {resolved_config_path}") from exc
+
+    # AppConfig é imutável, então a mesma instância pode ser compartilhada entre gerações.
+    file_fingerprint = (config_file_stat.st_mtime_ns, config_file_stat.st_size)
+    with _APP_CONFIG_CACHE_LOCK:
+        cached_entry = _APP_CONFIG_CACHE.get(resolved_config_path)
+        if cached_entry is not None and cached_entry[0] == file_fingerprint:
+            _APP_CONFIG_CACHE.move_to_end(resolved_config_path)
+            return cached_entry[1]
 
     try:
-        with resolved_config_path.open("r", encoding="utf-8") as config_file:
-            raw_config = json.load(config_file)
-    except json.JSONDecodeError as exc:
+        raw_config = decode_json_bytes(resolved_config_path.read_bytes(), encoding="utf-8")
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ConfigurationError(
             f"Configuration file has invalid JSON: {resolved_config_path}"
         ) from exc
 
-    return _parse_config(raw_config)
+    app_config = _parse_config(raw_config)
+    with _APP_CONFIG_CACHE_LOCK:
+        _APP_CONFIG_CACHE[resolved_config_path] = (file_fingerprint, app_config)
+        _APP_CONFIG_CACHE.move_to_end(resolved_config_path)
+        while len(_APP_CONFIG_CACHE) > APP_CONFIG_CACHE_SIZE:
+            # Descarta as configuracoes usadas ha mais tempo.
+            _APP_CONFIG_CACHE.popitem(last=False)
+    return app_config
 
 
 # Valida chaves obrigatorias e converte valores crus em estruturas com tipos explicitos.
-def _parse_config(raw_config: dict[str, Any]) -> AppConfig:
+def _parse_config(raw_config: Any) -> AppConfig:
+    # Estrutura inesperada vira erro de configuracao tipado, nunca AttributeError.
+    if not isinstance(raw_config, dict):
+        raise ConfigurationError("Configuration root must be a JSON object")
+
     files_section = raw_config.get("files")
-    defaults_section = raw_config.get("defaults", {})
-    logging_section = raw_config.get("logging", {})
+    defaults_section = _parse_optional_section(raw_config, "defaults")
+    logging_section = _parse_optional_section(raw_config, "logging")
 
     if not isinstance(files_section, dict):
         raise ConfigurationError("Missing required 'files' section in config")
@@ -129,6 +161,16 @@ def _parse_config(raw_config: dict[str, Any]) -> AppConfig:
     )
 
 
+# Retorna secao opcional do config, exigindo dicionario quando a chave estiver presente.
+def _parse_optional_section(raw_config: dict[str, Any], section_key: str) -> dict[str, Any]:
+    section_data = raw_config.get(section_key)
+    if section_data is None:
+        return {}
+    if not isinstance(section_data, dict):
+        raise ConfigurationError(f"Section '{section_key}' must be a dictionary")
+    return section_data
+
+
 # Valida mapeamentos por idioma e normaliza codigos para lowercase.
 def _parse_language_mapping(
     raw_mapping: Any,
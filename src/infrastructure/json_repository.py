@@ -2,23 +2,46 @@
 from __future__ import annotations
 
 import json
+import mmap
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from exceptions import JsonFileNotFoundError, JsonParsingError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+# orjson decodifica apenas UTF-8; demais encodings seguem pelo parser padrão.
+ORJSON_COMPATIBLE_ENCODINGS = {"utf-8", "utf8", "utf_8"}
+# Acima deste tamanho o arquivo é mapeado em memória; abaixo, o custo de setup do mmap não compensa.
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+# Limite de documentos mantidos em cache; processos longos com muitas entradas nao crescem sem limite.
+JSON_DOCUMENT_CACHE_SIZE = 32
+
+# Bytes lidos por caminho/encoding (ordem LRU), validos enquanto mtime/tamanho do arquivo nao mudarem.
+_JSON_DOCUMENT_CACHE: OrderedDict[tuple[Path, str], tuple[tuple[int, int], bytes]] = OrderedDict()
+# O repositorio pode ser chamado de varias threads por quem o embute; a reordenacao LRU precisa ser atomica.
+_JSON_DOCUMENT_CACHE_LOCK = threading.Lock()
+
 
 # Le um JSON como dicionario e converte erros de arquivo/parser para excecoes de dominio.
 def load_json(file_path: Path, *, encoding: str = "utf-8") -> dict[str, Any]:
-    resolved_path = file_path.expanduser().resolve()
+    return load_resolved_json(file_path.expanduser().resolve(), encoding=encoding)
 
-    if not resolved_path.exists():
-        raise JsonFileNotFoundError(f"JSON file not found: {resolved_path}")
 
+# Variante para caminhos ja resolvidos pelo chamador, evitando novo `resolve()` (syscalls) por leitura.
+def load_resolved_json(resolved_path: Path, *, encoding: str = "utf-8") -> dict[str, Any]:
     try:
-        with resolved_path.open("r", encoding=encoding) as json_file:
-            data = json.load(json_file)
-    except json.JSONDecodeError as exc:
+        data = _read_json_document(resolved_path, encoding=encoding)
+    except FileNotFoundError as exc:
+        # Ausencia do arquivo e detectada na propria abertura, sem `exists()` previo.
+        raise JsonFileNotFoundError(f"JSON file not found: {resolved_path}") from exc
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise JsonParsingError(f"Invalid JSON file: {resolved_path}") from exc
 
     # O serviço assume estrutura de objeto no nível raiz para acessar chaves nomeadas.
@@ -28,3 +51,60 @@ def load_json(file_path: Path, *, encoding: str = "utf-8") -> dict[str, Any]:
         )
 
     return data
+
+
+# Decodifica bytes JSON usando orjson quando instalado, com fallback para a biblioteca padrao.
+def decode_json_bytes(raw_content: bytes, *, encoding: str = "utf-8") -> Any:
+    if _can_use_orjson(encoding):
+        # `orjson.JSONDecodeError` herda de `json.JSONDecodeError`, preservando o tratamento de erro.
+        return orjson.loads(raw_content)
+    return json.loads(raw_content.decode(encoding))
+
+
+# Parseia o documento a cada chamada, reaproveitando do cache apenas os bytes de arquivos inalterados.
+def _read_json_document(resolved_path: Path, *, encoding: str) -> Any:
+    file_stat = resolved_path.stat()
+    file_size = file_stat.st_size
+    if file_size > MMAP_THRESHOLD_BYTES and _can_use_orjson(encoding):
+        # Arquivos grandes sao mapeados e parseados sem copia; o page cache do SO ja evita reler o disco.
+        with resolved_path.open("rb", buffering=0) as json_file:
+            with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                # A view precisa ser liberada antes de fechar o mapeamento.
+                with memoryview(mapped_file) as mapped_view:
+                    return orjson.loads(mapped_view)
+
+    # Lotes e execucoes multi-idioma releem os mesmos arquivos; sem mudanca no disco, nem abrem o arquivo.
+    # Cada chamada recebe um documento novo: mutacoes de um chamador nao vazam para as geracoes seguintes.
+    cache_key = (resolved_path, encoding)
+    file_fingerprint = (file_stat.st_mtime_ns, file_size)
+    with _JSON_DOCUMENT_CACHE_LOCK:
+        cached_entry = _JSON_DOCUMENT_CACHE.get(cache_key)
+        if cached_entry is not None and cached_entry[0] == file_fingerprint:
+            _JSON_DOCUMENT_CACHE.move_to_end(cache_key)
+            return decode_json_bytes(cached_entry[1], encoding=encoding)
+
+    raw_content = _read_json_bytes(resolved_path, file_size)
+    # Arquivo alterado durante a leitura nao corresponde ao fingerprint; nao entra no cache.
+    if len(raw_content) == file_size:
+        with _JSON_DOCUMENT_CACHE_LOCK:
+            _JSON_DOCUMENT_CACHE[cache_key] = (file_fingerprint, raw_content)
+            _JSON_DOCUMENT_CACHE.move_to_end(cache_key)
+            while len(_JSON_DOCUMENT_CACHE) > JSON_DOCUMENT_CACHE_SIZE:
+                # Descarta os documentos usados ha mais tempo.
+                _JSON_DOCUMENT_CACHE.popitem(last=False)
+    return decode_json_bytes(raw_content, encoding=encoding)
+
+
+# Le o arquivo inteiro com um unico `read` sem buffer, dimensionado pelo tamanho informado pelo stat.
+def _read_json_bytes(resolved_path: Path, file_size: int) -> bytes:
+    with resolved_path.open("rb", buffering=0) as json_file:
+        raw_content = json_file.read(file_size + 1)
+        if len(raw_content) > file_size:
+            # Arquivo cresceu apos o stat; completa a leitura ate o fim.
+            raw_content += json_file.readall()
+    return raw_content
+
+
+# Indica se o parser rapido esta disponivel para o encoding configurado.
+def _can_use_orjson(encoding: str) -> bool:
+    return orjson is not None and encoding.lower() in ORJSON_COMPATIBLE_ENCODINGS
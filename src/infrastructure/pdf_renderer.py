@@ -1,7 +1,10 @@
 # Renderizador principal que converte dados do curriculo em um documento PDF com ReportLab.
 from __future__ import annotations
 
+import io
+import os
 import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -37,9 +40,14 @@ class CvPdfRenderer:
     # - escrita de arquivo PDF
     # - emissão de logs do processo
 
+    # Prefixo internacional aplicado ao telefone no currículo em inglês.
+    INTERNATIONAL_PHONE_TEMPLATE = "+55 %s"
+    # Link social do cabeçalho: URL, cor e rótulo já escapados.
+    SOCIAL_LINK_TEMPLATE = '<a href="%s" color="%s">%s</a>'
+
     # Ordem padrão quando o JSON não especifica a ordem das seções.
-    # Manter essa lista evita que o PDF fique sem estrutura em casos incompletos.
-    DEFAULT_SECTION_ORDER = [
+    # Manter essa tupla evita que o PDF fique sem estrutura em casos incompletos.
+    DEFAULT_SECTION_ORDER = (
         "experience",
         "education",
         "core_skills",
@@ -47,12 +55,13 @@ class CvPdfRenderer:
         "languages",
         "awards",
         "certifications",
-    ]
+    )
 
     # Propósito:
     # - inicializar dependências de estilo e registro de formatadores.
     # Efeitos:
     # - instancia `PdfStyleEngine`
+    # - constrói stylesheet, cor escapada dos links e margens uma única vez, reaproveitadas em cada `render_cv`
     # - monta registry de formatadores com idioma/traduções.
     def __init__(
         self,
@@ -64,6 +73,20 @@ class CvPdfRenderer:
         self.language = language
         self.translations = translations
         self.pdf_style_engine = PdfStyleEngine(visual_settings)
+        self.styles = self.pdf_style_engine.build_stylesheet()
+        # Escapa atributos de cor para não quebrar a marcação XML interna do ReportLab.
+        self.escaped_link_color = escape_xml_attribute(self.pdf_style_engine.social_link_color())
+        # Diretórios de saída já garantidos; em lotes o `mkdir` roda uma vez por pasta.
+        self._ensured_output_directories: set[Path] = set()
+        # Títulos de seção traduzidos e escapados, resolvidos no primeiro uso de cada seção.
+        self._section_titles: dict[str, str] = {}
+        # Margens da página já convertidas de milímetros para pontos, no formato aceito pelo ReportLab.
+        self.page_margins = {
+            "rightMargin": self.pdf_style_engine.margin("right") * mm,
+            "leftMargin": self.pdf_style_engine.margin("left") * mm,
+            "topMargin": self.pdf_style_engine.margin("top") * mm,
+            "bottomMargin": self.pdf_style_engine.margin("bottom") * mm,
+        }
         self.section_formatter_registry = build_default_section_formatter_registry(
             language=language,
             translations=translations,
@@ -76,7 +99,7 @@ class CvPdfRenderer:
     # - `Path` do arquivo PDF gerado.
     # Efeitos:
     # - cria diretório de saída se necessário
-    # - grava o arquivo PDF
+    # - monta o PDF em memória e grava o arquivo com uma única escrita, substituído atomicamente
     # - registra logs de início/fim e pode lançar `PdfRenderError`.
     def render_cv(
         self,
@@ -86,16 +109,21 @@ class CvPdfRenderer:
         app_logger: Any,
     ) -> Path:
         # Garante que a pasta de destino exista antes de tentar gravar o PDF.
-        output_file_path.parent.mkdir(parents=True, exist_ok=True)
+        output_directory = output_file_path.parent
+        if output_directory not in self._ensured_output_directories:
+            output_directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_output_directories.add(output_directory)
+
+        # O PDF é montado em memória e gravado em disco com uma única escrita ao final.
+        pdf_buffer = io.BytesIO()
 
-        # Configura documento base (página A4 e margens convertidas para milímetros).
+        # Configura documento base (página A4 e margens pré-calculadas no construtor).
+        # Compressão fixada explicitamente: não depende de `rl_config` local do ReportLab.
         document = SimpleDocTemplate(
-            str(output_file_path),
+            pdf_buffer,
             pagesize=A4,
-            rightMargin=self.pdf_style_engine.margin("right") * mm,
-            leftMargin=self.pdf_style_engine.margin("left") * mm,
-            topMargin=self.pdf_style_engine.margin("top") * mm,
-            bottomMargin=self.pdf_style_engine.margin("bottom") * mm,
+            pageCompression=1,
+            **self.page_margins,
         )
 
         app_logger.bind(event="pdf_build_started", step="pdf_renderer").info(
@@ -104,7 +132,7 @@ class CvPdfRenderer:
 
         # `elements` é a sequência de blocos visuais que o ReportLab vai desenhar.
         elements: list[Any] = []
-        styles = self.pdf_style_engine.build_stylesheet()
+        styles = self.styles
 
         self._add_header(elements, styles, cv_data)
         self._add_summary(elements, styles, cv_data)
@@ -115,6 +143,17 @@ class CvPdfRenderer:
         except Exception as exc:  # pragma: no cover - external library behavior
             raise PdfRenderError(f"Failed to build PDF: {output_file_path}") from exc
 
+        # Grava em arquivo temporário na mesma pasta e troca atomicamente: leitores nunca veem um PDF parcial.
+        temporary_file_path = output_file_path.with_name(f".{output_file_path.name}.{os.getpid()}.tmp")
+        try:
+            # `getbuffer()` expõe o conteúdo sem copiar; maior que o buffer do arquivo, segue direto para o disco.
+            with pdf_buffer.getbuffer() as pdf_bytes, temporary_file_path.open("wb") as pdf_file:
+                pdf_file.write(pdf_bytes)
+            os.replace(temporary_file_path, output_file_path)
+        except OSError as exc:
+            temporary_file_path.unlink(missing_ok=True)
+            raise PdfRenderError(f"Failed to write PDF: {output_file_path}") from exc
+
         app_logger.bind(event="pdf_build_finished", step="pdf_renderer").info(
             "PDF built successfully"
         )
@@ -132,6 +171,10 @@ class CvPdfRenderer:
         cv_data: dict[str, Any],
         app_logger: Any,
     ) -> None:
+        # Referências invariantes entre seções ficam em variáveis locais fora do laço.
+        get_formatter = self.section_formatter_registry.get_formatter
+        section_spacing = self.pdf_style_engine.spacing_points("item_bottom")
+
         # Define a ordem real (vinda do JSON ou fallback padrão).
         for section_type in self._resolve_sections_to_render(cv_data):
             section_items = cv_data.get(section_type, [])
@@ -146,7 +189,7 @@ class CvPdfRenderer:
                 ).warning("Section data is not a list; skipping section")
                 continue
 
-            formatter = self.section_formatter_registry.get_formatter(section_type)
+            formatter = get_formatter(section_type)
             if not formatter:
                 app_logger.bind(event="section_render_skipped", step=section_type).warning(
                     "Unknown section type; skipping section"
@@ -157,10 +200,9 @@ class CvPdfRenderer:
             section_start = time.perf_counter()
 
             self._add_section_title(elements, styles, section_type)
-            for item in section_items:
-                # Delega a formatação do item para o formatador específico da seção.
-                formatter.format_section_item(elements, styles, item)
-            elements.append(Spacer(1, self.pdf_style_engine.spacing("item_bottom") * mm))
+            # Delega a formatação dos itens ao formatador, que pode agrupá-los em menos parágrafos.
+            formatter.format_section_items(elements, styles, section_items)
+            elements.append(Spacer(1, section_spacing))
 
             elapsed_ms = int((time.perf_counter() - section_start) * 1000)
             app_logger.bind(
@@ -172,30 +214,33 @@ class CvPdfRenderer:
     # Propósito:
     # - decidir quais seções serão renderizadas e em qual ordem.
     # Retorno:
-    # - lista de nomes de seção (`list[str]`).
-    def _resolve_sections_to_render(self, cv_data: dict[str, Any]) -> list[str]:
+    # - sequência de nomes de seção (`Sequence[str]`).
+    def _resolve_sections_to_render(self, cv_data: dict[str, Any]) -> Sequence[str]:
         sections_config = cv_data.get("sections")
         # Se não houver configuração válida, usa ordem padrão definida na classe.
         if not isinstance(sections_config, list):
             return self.DEFAULT_SECTION_ORDER
 
-        # Mantém apenas seções habilitadas (enabled=True ou omitido).
-        enabled_sections = [
-            section
-            for section in sections_config
-            if isinstance(section, dict) and section.get("enabled", True)
-        ]
-        # Ordena por campo `order` (quanto menor, mais acima no PDF).
-        sorted_sections = sorted(enabled_sections, key=lambda section: section.get("order", 999))
-
-        section_types: list[str] = []
-        for section in sorted_sections:
-            section_type = section.get("type")
-            # Evita repetição de seção quando o JSON tiver entradas duplicadas.
-            if isinstance(section_type, str) and section_type and section_type not in section_types:
-                section_types.append(section_type)
+        # Mantém apenas seções habilitadas (enabled=True ou omitido) e ordena por `order`
+        # (quanto menor, mais acima no PDF) sem materializar lista intermediária.
+        sorted_sections = sorted(
+            (
+                section
+                for section in sections_config
+                if isinstance(section, dict) and section.get("enabled", True)
+            ),
+            key=lambda section: section.get("order", 999),
+        )
 
-        return section_types
+        section_types = (section.get("type") for section in sorted_sections)
+        # `dict.fromkeys` remove duplicatas do JSON mantendo a primeira ocorrência, sem busca linear.
+        return list(
+            dict.fromkeys(
+                section_type
+                for section_type in section_types
+                if isinstance(section_type, str) and section_type
+            )
+        )
 
     # Propósito:
     # - montar o cabeçalho do currículo (nome, cargo, contatos e links sociais).
@@ -217,54 +262,61 @@ class CvPdfRenderer:
         if desired_role:
             elements.append(Paragraph(escape_text_preserving_tags(desired_role), styles["TitleStyle"]))
 
-        # Junta contatos em uma linha separada por `|` para leitura compacta.
-        contact_items: list[str] = []
-        phone_number = str(personal_info.get("phone", "")).strip()
-        if phone_number:
-            # Regra de negócio atual: quando idioma é inglês e faltou prefixo +55, prefixa.
-            if self.language == "en" and not phone_number.startswith("+55"):
-                phone_number = f"+55 {phone_number}"
-            contact_items.append(phone_number)
-
-        email = str(personal_info.get("email", "")).strip()
-        if email:
-            contact_items.append(email)
-
-        location = str(personal_info.get("location", "")).strip()
-        if location:
-            contact_items.append(location)
-
-        if contact_items:
-            contact_text = " | ".join(contact_items)
+        # Junta contatos preenchidos em uma linha separada por `|` para leitura compacta.
+        contact_text = " | ".join(
+            contact_item
+            for contact_item in (
+                self._format_phone_number(personal_info.get("phone", "")),
+                str(personal_info.get("email", "")).strip(),
+                str(personal_info.get("location", "")).strip(),
+            )
+            if contact_item
+        )
+        if contact_text:
             elements.append(Paragraph(escape_text_preserving_tags(contact_text), styles["ContactStyle"]))
 
         social_items = personal_info.get("social") or []
         if isinstance(social_items, list) and social_items:
-            social_links: list[str] = []
-            # Escapa atributos de cor para não quebrar a marcação XML interna do ReportLab.
-            escaped_link_color = escape_xml_attribute(
-                self.pdf_style_engine.social_link_color()
+            # Uma única passada gera os links e já os junta, sem lista intermediária.
+            social_text = " | ".join(
+                social_link
+                for social_link in map(self._format_social_link, social_items)
+                if social_link
             )
-            for social_item in social_items:
-                if not isinstance(social_item, dict):
-                    continue
-                label = str(social_item.get("label", "")).strip()
-                url = str(social_item.get("url", "")).strip()
-                if not url:
-                    continue
-
-                # Escapa URL/label para evitar caracteres inválidos no elemento `<a>`.
-                escaped_url = escape_xml_attribute(url)
-                label_text = label or url
-                escaped_label = escape_text_preserving_tags(label_text)
-                social_links.append(
-                    f'<a href="{escaped_url}" color="{escaped_link_color}">{escaped_label}</a>'
-                )
+            if social_text:
+                elements.append(Paragraph(social_text, styles["ContactStyle"]))
+
+        elements.append(Spacer(1, self.pdf_style_engine.spacing_points("header_bottom")))
 
-            if social_links:
-                elements.append(Paragraph(" | ".join(social_links), styles["ContactStyle"]))
+    # Propósito:
+    # - normalizar o telefone exibido no cabeçalho.
+    # Retorno:
+    # - telefone sem espaços nas pontas, com prefixo internacional no currículo em inglês.
+    def _format_phone_number(self, raw_phone_number: Any) -> str:
+        phone_number = str(raw_phone_number).strip()
+        # Regra de negócio atual: quando idioma é inglês e faltou prefixo +55, prefixa.
+        if phone_number and self.language == "en" and not phone_number.startswith("+55"):
+            return self.INTERNATIONAL_PHONE_TEMPLATE % phone_number
+        return phone_number
 
-        elements.append(Spacer(1, self.pdf_style_engine.spacing("header_bottom") * mm))
+    # Propósito:
+    # - converter um item de rede social em link clicável do cabeçalho.
+    # Retorno:
+    # - markup `<a>` do link, ou string vazia quando o item é inválido ou não tem URL.
+    def _format_social_link(self, social_item: Any) -> str:
+        if not isinstance(social_item, dict):
+            return ""
+        url = str(social_item.get("url", "")).strip()
+        if not url:
+            return ""
+
+        label = str(social_item.get("label", "")).strip()
+        # Escapa URL/label para evitar caracteres inválidos no elemento `<a>`.
+        return self.SOCIAL_LINK_TEMPLATE % (
+            escape_xml_attribute(url),
+            self.escaped_link_color,
+            escape_text_preserving_tags(label or url),
+        )
 
     # Propósito:
     # - inserir seção de resumo profissional, quando houver conteúdo.
@@ -276,30 +328,38 @@ class CvPdfRenderer:
             # Sem resumo não há seção para renderizar.
             return
 
-        # Título é traduzido conforme idioma selecionado.
-        section_title = get_translation(
-            self.translations,
-            self.language,
-            "sections",
-            "summary",
-            "Summary",
+        elements.extend(
+            (
+                Paragraph(self._section_title_text("summary", "Summary"), styles["SectionTitleStyle"]),
+                Paragraph(process_rich_text(summary), styles["BodyStyle"]),
+                Spacer(1, self.pdf_style_engine.spacing_points("section_bottom")),
+            )
         )
-        elements.append(Paragraph(escape_text_preserving_tags(section_title), styles["SectionTitleStyle"]))
-        elements.append(Paragraph(process_rich_text(summary), styles["BodyStyle"]))
-        elements.append(Spacer(1, self.pdf_style_engine.spacing("section_bottom") * mm))
 
     # Propósito:
     # - renderizar o título visível de cada seção dinâmica.
     # Efeitos:
     # - adiciona um `Paragraph` ao fluxo de elementos.
     def _add_section_title(self, elements: list[Any], styles: StyleSheet1, section_type: str) -> None:
-        section_title = get_translation(
-            self.translations,
-            self.language,
-            "sections",
-            section_type,
-            section_type,
-        )
         elements.append(
-            Paragraph(escape_text_preserving_tags(section_title), styles["SectionTitleStyle"])
+            Paragraph(self._section_title_text(section_type, section_type), styles["SectionTitleStyle"])
         )
+
+    # Propósito:
+    # - traduzir e escapar o título de uma seção uma única vez por renderizador.
+    # Retorno:
+    # - markup pronta do título, reaproveitada nas renderizações seguintes.
+    def _section_title_text(self, section_type: str, default_title: str) -> str:
+        section_title = self._section_titles.get(section_type)
+        if section_title is None:
+            # Título é traduzido conforme idioma selecionado.
+            translated_title = get_translation(
+                self.translations,
+                self.language,
+                "sections",
+                section_type,
+                default_title,
+            )
+            section_title = escape_text_preserving_tags(translated_title)
+            self._section_titles[section_type] = section_title
+        return section_title
@@ -8,6 +8,7 @@ from infrastructure.pdf_sections.simple import (
     AwardsSectionFormatter,
     CertificationsSectionFormatter,
     CoreSkillsSectionFormatter,
+    InlineSectionFormatter,
     LanguagesSectionFormatter,
     SkillsSectionFormatter,
 )
@@ -24,6 +25,7 @@ __all__ = [
     "CoreSkillsSectionFormatter",
     "EducationSectionFormatter",
     "ExperienceSectionFormatter",
+    "InlineSectionFormatter",
     "LanguagesSectionFormatter",
     "SectionFormatterRegistry",
     "SkillsSectionFormatter",
@@ -5,7 +5,6 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from reportlab.lib.styles import StyleSheet1
-from reportlab.lib.units import mm
 from reportlab.platypus import Paragraph, Spacer
 
 from localization import (
@@ -17,12 +16,19 @@ from localization import (
 )
 from infrastructure.pdf_styles import PdfStyleEngine
 
+# Templates de markup montados com `%`, reaproveitados por todos os itens renderizados.
+BOLD_MARKUP_TEMPLATE = "<b>%s</b>"
+ITALIC_MARKUP_TEMPLATE = "<i>%s</i>"
+BOLD_WITH_DETAIL_TEMPLATE = "<b>%s</b>%s%s"
+BULLET_LINE_TEMPLATE = "• %s"
+
 
 # Extrai inicio/fim do item e delega a formatacao de periodo para utilitario comum.
 def build_period_text(
     section_item: dict[str, Any],
     translations: dict[str, Any],
     language: str,
+    current_label: str | None = None,
 ) -> str:
     # Campos ausentes viram string vazia para manter formato robusto.
     return format_period(
@@ -32,11 +38,14 @@ def build_period_text(
         end_year=section_item.get("end_year", ""),
         translations=translations,
         language=language,
+        current_label=current_label,
     )
 
 
 # Contrato base com helpers de localizacao e montagem de paragrafo para todas as secoes.
 class BaseSectionFormatter(ABC):
+    # Sem `__dict__` por instancia: atributos fixos sao lidos via slots; subclasses declaram os seus.
+    __slots__ = ("language", "translations", "pdf_style_engine")
 
     # Armazena idioma, traducoes e motor de estilos compartilhados por cada item renderizado.
     def __init__(
@@ -61,6 +70,17 @@ class BaseSectionFormatter(ABC):
         # Define o contrato de formatacao que deve ser implementado pelas subclasses.
         pass
 
+    # Renderiza todos os itens da secao; subclasses podem agrupar itens em menos elementos.
+    def format_section_items(
+        self,
+        elements: list[Any],
+        styles: StyleSheet1,
+        section_items: list[Any],
+    ) -> None:
+        format_section_item = self.format_section_item
+        for section_item in section_items:
+            format_section_item(elements, styles, section_item)
+
     # Resolve um campo textual localizado para o idioma ativo da renderizacao.
     def localized_field(
         self,
@@ -84,7 +104,7 @@ class BaseSectionFormatter(ABC):
     ) -> None:
         if text:
             safe_text = escape_text_preserving_tags(text)
-            elements.append(Paragraph(f"<b>{safe_text}</b>", styles[style_name]))
+            elements.append(Paragraph(BOLD_MARKUP_TEMPLATE % safe_text, styles[style_name]))
 
     # Adiciona paragrafo em italico apenas quando houver texto util.
     def add_italic_paragraph(
@@ -96,7 +116,7 @@ class BaseSectionFormatter(ABC):
     ) -> None:
         if text:
             safe_text = escape_text_preserving_tags(text)
-            elements.append(Paragraph(f"<i>{safe_text}</i>", styles[style_name]))
+            elements.append(Paragraph(ITALIC_MARKUP_TEMPLATE % safe_text, styles[style_name]))
 
     # Adiciona paragrafo simples com escape para evitar markup invalida no PDF.
     def add_plain_paragraph(
@@ -121,7 +141,7 @@ class BaseSectionFormatter(ABC):
         safe_detail_text = escape_text_preserving_tags(detail_text)
         # Evita inserir separador quando apenas um dos lados possui conteúdo.
         if safe_bold_text and safe_detail_text:
-            return f"<b>{safe_bold_text}</b>{separator}{safe_detail_text}"
+            return BOLD_WITH_DETAIL_TEMPLATE % (safe_bold_text, separator, safe_detail_text)
         return safe_bold_text or safe_detail_text
 
     # Insere texto rico no estilo de corpo mantendo padrao visual da secao.
@@ -158,13 +178,18 @@ class BaseSectionFormatter(ABC):
         styles: StyleSheet1,
         descriptions: list[str],
     ) -> None:
-        for description in descriptions:
-            elements.append(Paragraph(f"• {process_rich_text(description)}", styles["BodyStyle"]))
+        if not descriptions:
+            return
+        # Um único Paragraph por item evita reparsear markup e refazer o wrap para cada bullet.
+        bullet_lines = "<br/>".join(
+            BULLET_LINE_TEMPLATE % escaped_description
+            for escaped_description in map(process_rich_text, descriptions)
+        )
+        elements.append(Paragraph(bullet_lines, styles["BodyStyle"]))
 
-    # Aplica espacamento vertical por chave sem espalhar valores numericos no codigo.
+    # Aplica espacamento vertical por chave usando valores ja convertidos para pontos.
     def add_spacing(self, elements: list[Any], spacing_key: str) -> None:
-        spacing_value = self.pdf_style_engine.spacing(spacing_key)
-        elements.append(Spacer(1, spacing_value * mm))
+        elements.append(Spacer(1, self.pdf_style_engine.spacing_points(spacing_key)))
 
     # Renderiza titulo de categoria apenas quando o campo estiver preenchido.
     def add_category_title(
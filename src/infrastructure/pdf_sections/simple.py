@@ -1,82 +1,102 @@
 # Formatadores de secoes diretas (premios, idiomas, habilidades) com composicao enxuta.
 from __future__ import annotations
 
+from abc import abstractmethod
 from typing import Any
 
 from reportlab.lib.styles import StyleSheet1
 
+from localization import escape_text_preserving_tags
 from infrastructure.pdf_sections.base import BaseSectionFormatter
 
+# Template de certificacao por presenca de (nome, emissor, ano); ano so aparece junto de nome e emissor.
+CERTIFICATION_TEMPLATE_BY_PRESENCE = {
+    (True, True, True): "<b>%(name)s</b> - %(issuer)s (%(year)s)",
+    (True, True, False): "<b>%(name)s</b> - %(issuer)s",
+    (True, False, True): "%(name)s",
+    (True, False, False): "%(name)s",
+    (False, True, True): "%(issuer)s",
+    (False, True, False): "%(issuer)s",
+}
 
-# Renderiza itens de premios no formato titulo + descricao.
-class AwardsSectionFormatter(BaseSectionFormatter):
 
-    # Converte um premio em linha composta para o corpo da secao.
+# Base para secoes de uma linha por item, agrupadas em um unico paragrafo por secao.
+class InlineSectionFormatter(BaseSectionFormatter):
+    __slots__ = ()
+
+    # Define o texto rico (ja escapado) de um item; vazio quando nao houver conteudo.
+    @abstractmethod
+    def compose_item_text(self, section_item: dict[str, Any]) -> str:
+        # Define o contrato de composicao que deve ser implementado pelas subclasses.
+        pass
+
+    # Adiciona a linha de um item isolado no estilo de corpo.
     def format_section_item(
         self,
         elements: list[Any],
         styles: StyleSheet1,
         section_item: dict[str, Any],
     ) -> None:
-        title = self.localized_field(section_item, "title")
-        description = self.localized_field(section_item, "description")
-        self.add_composite_body_paragraph(
+        self.add_body_rich_paragraph(elements, styles, self.compose_item_text(section_item))
+
+    # Junta as linhas de todos os itens com <br/> para o ReportLab parsear um paragrafo por secao.
+    def format_section_items(
+        self,
+        elements: list[Any],
+        styles: StyleSheet1,
+        section_items: list[Any],
+    ) -> None:
+        item_texts = map(self.compose_item_text, section_items)
+        self.add_body_rich_paragraph(
             elements,
             styles,
-            main_text=title,
-            detail_text=description,
+            "<br/>".join(item_text for item_text in item_texts if item_text),
         )
 
 
+# Renderiza itens de premios no formato titulo + descricao.
+class AwardsSectionFormatter(InlineSectionFormatter):
+    __slots__ = ()
+
+    # Converte um premio em linha composta para o corpo da secao.
+    def compose_item_text(self, section_item: dict[str, Any]) -> str:
+        title = self.localized_field(section_item, "title")
+        description = self.localized_field(section_item, "description")
+        return self.compose_bold_with_detail_text(title, description)
+
+
 # Renderiza idiomas com nivel de proficiencia em formato compacto.
-class LanguagesSectionFormatter(BaseSectionFormatter):
+class LanguagesSectionFormatter(InlineSectionFormatter):
+    __slots__ = ()
 
     # Monta linha de idioma combinando nome e proficiencia localizada.
-    def format_section_item(
-        self,
-        elements: list[Any],
-        styles: StyleSheet1,
-        section_item: dict[str, Any],
-    ) -> None:
+    def compose_item_text(self, section_item: dict[str, Any]) -> str:
         language_name = self.localized_field(section_item, "language")
         proficiency = self.localized_field(section_item, "proficiency")
-        self.add_composite_body_paragraph(
-            elements,
-            styles,
-            main_text=language_name,
-            detail_text=proficiency,
-        )
+        return self.compose_bold_with_detail_text(language_name, proficiency)
 
 
 # Renderiza certificacoes preservando contexto de emissor e ano quando disponivel.
-class CertificationsSectionFormatter(BaseSectionFormatter):
+class CertificationsSectionFormatter(InlineSectionFormatter):
+    __slots__ = ()
 
     # Compoe texto de certificacao evitando exibir ano isolado sem nome do certificado.
-    def format_section_item(
-        self,
-        elements: list[Any],
-        styles: StyleSheet1,
-        section_item: dict[str, Any],
-    ) -> None:
-        certification_name = self.localized_field(section_item, "name")
-        issuer_name = self.localized_field(section_item, "issuer")
-        year = str(section_item.get("year", "")).strip()
-
-        detail_text = issuer_name
-        # Ano só aparece quando existe nome da certificação para evitar rótulo órfão.
-        if certification_name and issuer_name and year:
-            detail_text = f"{issuer_name} ({year})"
-
-        self.add_composite_body_paragraph(
-            elements,
-            styles,
-            main_text=certification_name,
-            detail_text=detail_text,
+    def compose_item_text(self, section_item: dict[str, Any]) -> str:
+        certification_name = escape_text_preserving_tags(self.localized_field(section_item, "name"))
+        issuer_name = escape_text_preserving_tags(self.localized_field(section_item, "issuer"))
+        year = escape_text_preserving_tags(str(section_item.get("year", "")).strip())
+
+        # Uma consulta na tabela substitui a cadeia de condicoes; sem nome nem emissor nao ha texto.
+        template = CERTIFICATION_TEMPLATE_BY_PRESENCE.get(
+            (bool(certification_name), bool(issuer_name), bool(year)),
+            "",
         )
+        return template % {"name": certification_name, "issuer": issuer_name, "year": year}
 
 
 # Renderiza grupos de habilidades em formato categoria + lista separada por virgulas.
 class SkillsSectionFormatter(BaseSectionFormatter):
+    __slots__ = ()
 
     # Adiciona titulo da categoria e lista de habilidades mantendo espacamento padrao.
     def format_section_item(
@@ -96,6 +116,7 @@ class SkillsSectionFormatter(BaseSectionFormatter):
 
 # Renderiza habilidades centrais como bullets por categoria.
 class CoreSkillsSectionFormatter(BaseSectionFormatter):
+    __slots__ = ()
 
     # Adiciona categoria e descricoes em bullet com espacamento minimo entre itens.
     def format_section_item(
@@ -5,11 +5,29 @@ from typing import Any
 
 from reportlab.lib.styles import StyleSheet1
 
+from localization import get_translation
 from infrastructure.pdf_sections.base import BaseSectionFormatter, build_period_text
+from infrastructure.pdf_styles import PdfStyleEngine
 
 
 # Base para secoes cronologicas com titulo, subtitulo, periodo e bullets.
 class TimelineSectionFormatter(BaseSectionFormatter):
+    __slots__ = ("current_label",)
+
+    # Resolve o rotulo de periodo em aberto ("atual") uma vez, em vez de a cada item.
+    def __init__(
+        self,
+        *,
+        language: str,
+        translations: dict[str, Any],
+        pdf_style_engine: PdfStyleEngine,
+    ) -> None:
+        super().__init__(
+            language=language,
+            translations=translations,
+            pdf_style_engine=pdf_style_engine,
+        )
+        self.current_label = get_translation(translations, language, "labels", "current", "Present")
 
     # Renderiza item cronologico respeitando ordem visual e formatacao de datas.
     def format_timeline_item(
@@ -23,7 +41,12 @@ class TimelineSectionFormatter(BaseSectionFormatter):
     ) -> None:
         title_text = self.localized_field(section_item, title_field)
         subtitle_text = self.localized_field(section_item, subtitle_field)
-        period_text = build_period_text(section_item, self.translations, self.language)
+        period_text = build_period_text(
+            section_item,
+            self.translations,
+            self.language,
+            current_label=self.current_label,
+        )
 
         # A ordem abaixo mantém leitura visual consistente no PDF.
         self.add_bold_paragraph(elements, styles, title_text, "ItemTitleStyle")
@@ -37,6 +60,7 @@ class TimelineSectionFormatter(BaseSectionFormatter):
 
 # Especializa timeline para experiencia profissional.
 class ExperienceSectionFormatter(TimelineSectionFormatter):
+    __slots__ = ()
 
     # Mapeia campos de experiencia (cargo/empresa) para o fluxo cronologico comum.
     def format_section_item(
@@ -56,6 +80,7 @@ class ExperienceSectionFormatter(TimelineSectionFormatter):
 
 # Especializa timeline para formacao academica.
 class EducationSectionFormatter(TimelineSectionFormatter):
+    __slots__ = ()
 
     # Mapeia campos de educacao (curso/instituicao) para o fluxo cronologico comum.
     def format_section_item(
@@ -1,11 +1,17 @@
 # Valida e converte o JSON de estilos para objetos ReportLab usados no documento final.
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+from reportlab.lib.fonts import ps2tt, tt2ps
 from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
 
 from exceptions import PdfRenderError
 
@@ -43,6 +49,13 @@ REQUIRED_SPACING_KEYS = [
     "small_bottom",
     "minimal_bottom",
 ]
+# Limite de estilos mantidos em cache; workers longos com varios estilos.json nao crescem sem limite.
+PARAGRAPH_STYLE_CACHE_SIZE = 128
+
+# Cache LRU de ParagraphStyle por (nome, cadeia de pais, definicao); estilos sao somente leitura durante o build.
+_PARAGRAPH_STYLE_CACHE: OrderedDict[tuple[Any, ...], ParagraphStyle] = OrderedDict()
+# Renderizadores podem ser montados em threads diferentes; a reordenacao LRU precisa ser atomica.
+_PARAGRAPH_STYLE_CACHE_LOCK = threading.Lock()
 
 
 # Faixada de acesso semantico para margens, espacamentos e estilos ja validados.
@@ -54,6 +67,11 @@ class PdfStyleEngine:
             style_configuration if isinstance(style_configuration, dict) else {}
         )
         validate_pdf_style_configuration(self.style_configuration)
+        # Espacamentos ja convertidos de milimetros para pontos, usados a cada Spacer.
+        self._spacing_points = {
+            spacing_key: resolve_spacing_value(self.style_configuration, spacing_key) * mm
+            for spacing_key in REQUIRED_SPACING_KEYS
+        }
 
     # Constroi stylesheet ReportLab a partir da configuracao validada.
     def build_stylesheet(self) -> StyleSheet1:
@@ -67,6 +85,13 @@ class PdfStyleEngine:
     def spacing(self, spacing_key: str) -> float:
         return resolve_spacing_value(self.style_configuration, spacing_key)
 
+    # Retorna espacamento semantico em pontos, pronto para uso em `Spacer`.
+    def spacing_points(self, spacing_key: str) -> float:
+        spacing_points = self._spacing_points.get(spacing_key)
+        if spacing_points is None:
+            return self.spacing(spacing_key) * mm
+        return spacing_points
+
     # Retorna a cor configurada para links sociais no cabecalho.
     def social_link_color(self) -> str:
         return resolve_social_link_color(self.style_configuration)
@@ -88,7 +113,9 @@ def validate_pdf_style_configuration(style_configuration: dict[str, Any]) -> Non
 # Transforma definicoes do JSON em ParagraphStyle compreensivel pelo ReportLab.
 def build_pdf_stylesheet(style_configuration: dict[str, Any]) -> StyleSheet1:
     paragraph_styles = style_configuration["paragraph_styles"]
-    stylesheet = getSampleStyleSheet()
+    stylesheet = _new_stylesheet_from_sample()
+    # Chave de cache de cada estilo customizado; estilos da amostra do ReportLab sao identificados pelo nome.
+    cache_key_by_style_name: dict[str, tuple[Any, ...]] = {}
 
     for style_name, style_definition in paragraph_styles.items():
         if not isinstance(style_name, str) or not isinstance(style_definition, dict):
@@ -97,20 +124,22 @@ def build_pdf_stylesheet(style_configuration: dict[str, Any]) -> StyleSheet1:
             continue
 
         parent_name = str(style_definition.get("parent", "Normal"))
-        parent_style = (
-            stylesheet[parent_name]
-            if parent_name in stylesheet.byName
-            else stylesheet["Normal"]
-        )
-        # Traduz nomenclatura do JSON para os parâmetros esperados pelo ReportLab.
-        style_kwargs = _build_paragraph_style_kwargs(style_definition)
-        stylesheet.add(
-            ParagraphStyle(
-                name=style_name,
-                parent=parent_style,
-                **style_kwargs,
-            )
+        if parent_name not in stylesheet.byName:
+            parent_name = "Normal"
+        parent_style = stylesheet[parent_name]
+        if parent_name in cache_key_by_style_name:
+            parent_cache_key = cache_key_by_style_name[parent_name]
+        else:
+            parent_cache_key = ("sample", parent_name)
+
+        paragraph_style, style_cache_key = _get_or_create_paragraph_style(
+            style_name,
+            parent_style,
+            parent_cache_key,
+            style_definition,
         )
+        cache_key_by_style_name[style_name] = style_cache_key
+        stylesheet.add(paragraph_style)
 
     return stylesheet
 
@@ -207,6 +236,75 @@ def _require_required_keys(
             )
 
 
+# Constroi a stylesheet de amostra do ReportLab uma unica vez por processo.
+@lru_cache(maxsize=1)
+def _sample_stylesheet() -> StyleSheet1:
+    return getSampleStyleSheet()
+
+
+# Cria stylesheet propria com os estilos de amostra compartilhados, isolando os estilos adicionados.
+def _new_stylesheet_from_sample() -> StyleSheet1:
+    sample_stylesheet = _sample_stylesheet()
+    stylesheet = StyleSheet1()
+    stylesheet.byName.update(sample_stylesheet.byName)
+    stylesheet.byAlias.update(sample_stylesheet.byAlias)
+    return stylesheet
+
+
+# Reaproveita ParagraphStyle ja construido para a mesma definicao, evitando merges repetidos do ReportLab.
+def _get_or_create_paragraph_style(
+    style_name: str,
+    parent_style: ParagraphStyle,
+    parent_cache_key: tuple[Any, ...] | None,
+    style_definition: dict[str, Any],
+) -> tuple[ParagraphStyle, tuple[Any, ...] | None]:
+    cache_key = _build_paragraph_style_cache_key(style_name, parent_cache_key, style_definition)
+    if cache_key is not None:
+        with _PARAGRAPH_STYLE_CACHE_LOCK:
+            cached_style = _PARAGRAPH_STYLE_CACHE.get(cache_key)
+            if cached_style is not None:
+                _PARAGRAPH_STYLE_CACHE.move_to_end(cache_key)
+                return cached_style, cache_key
+
+    # Traduz nomenclatura do JSON para os parâmetros esperados pelo ReportLab.
+    style_kwargs = _build_paragraph_style_kwargs(style_definition)
+    paragraph_style = ParagraphStyle(
+        name=style_name,
+        parent=parent_style,
+        **style_kwargs,
+    )
+    if cache_key is not None:
+        with _PARAGRAPH_STYLE_CACHE_LOCK:
+            _PARAGRAPH_STYLE_CACHE[cache_key] = paragraph_style
+            while len(_PARAGRAPH_STYLE_CACHE) > PARAGRAPH_STYLE_CACHE_SIZE:
+                # Descarta os estilos usados ha mais tempo.
+                _PARAGRAPH_STYLE_CACHE.popitem(last=False)
+    return paragraph_style, cache_key
+
+
+# Monta chave estavel do estilo ou None quando a definicao (ou o pai) nao pode ser cacheada.
+def _build_paragraph_style_cache_key(
+    style_name: str,
+    parent_cache_key: tuple[Any, ...] | None,
+    style_definition: dict[str, Any],
+) -> tuple[Any, ...] | None:
+    if parent_cache_key is None:
+        return None
+
+    definition_items = tuple(
+        (setting_key, style_definition[setting_key])
+        for setting_key in STYLE_FIELD_MAPPING
+        if setting_key in style_definition
+    )
+    cache_key = (style_name, parent_cache_key, definition_items)
+    try:
+        hash(cache_key)
+    except TypeError:
+        # Valores não hasheáveis (ex.: listas no JSON) seguem sem cache.
+        return None
+    return cache_key
+
+
 # Converte campos do JSON para kwargs compatíveis com ParagraphStyle.
 def _build_paragraph_style_kwargs(style_definition: dict[str, Any]) -> dict[str, Any]:
     style_kwargs: dict[str, Any] = {}
@@ -221,6 +319,9 @@ def _build_paragraph_style_kwargs(style_definition: dict[str, Any]) -> dict[str,
         if setting_key == "text_color":
             style_kwargs[reportlab_key] = _resolve_color(setting_value)
             continue
+        if setting_key == "font_name":
+            style_kwargs[reportlab_key] = _resolve_font_name(setting_value)
+            continue
 
         style_kwargs[reportlab_key] = setting_value
 
@@ -237,11 +338,42 @@ def _resolve_alignment(alignment_value: Any) -> int:
     return ALIGNMENT_BY_NAME.get(alignment_value.lower(), TA_LEFT)
 
 
+# Garante que a fonte exista no registro do ReportLab antes do layout, com erro explicito se desconhecida.
+def _resolve_font_name(font_name: Any) -> str:
+    if not isinstance(font_name, str) or not font_name.strip():
+        raise PdfRenderError("Paragraph style 'font_name' must be a non-empty string")
+    try:
+        _preload_font_family(font_name)
+    except KeyError as lookup_error:
+        raise PdfRenderError(f"Unknown paragraph style font: {font_name}") from lookup_error
+    return font_name
+
+
+# Carrega a fonte e suas variantes <b>/<i> uma vez por processo, tirando esse custo do primeiro wrap.
+@lru_cache(maxsize=None)
+def _preload_font_family(font_name: str) -> None:
+    pdfmetrics.getFont(font_name)
+    try:
+        font_family, _, _ = ps2tt(font_name)
+    except ValueError:
+        # Fontes sem familia mapeada nao possuem variantes para aquecer.
+        return
+    for is_bold in (0, 1):
+        for is_italic in (0, 1):
+            pdfmetrics.getFont(tt2ps(font_family, is_bold, is_italic))
+
+
 # Converte string de cor para objeto ReportLab e falha com mensagem explicita se invalida.
 def _resolve_color(color_value: Any) -> colors.Color:
     if not isinstance(color_value, str) or not color_value.strip():
         raise PdfRenderError("Paragraph style 'text_color' must be a non-empty string")
     try:
-        return colors.toColor(color_value)
+        return _parse_color(color_value)
     except ValueError as parse_error:
         raise PdfRenderError(f"Invalid paragraph style color: {color_value}") from parse_error
+
+
+# Converte cada string de cor uma unica vez por processo; objetos Color nao sao alterados pelo ReportLab.
+@lru_cache(maxsize=256)
+def _parse_color(color_value: str) -> colors.Color:
+    return colors.toColor(color_value)
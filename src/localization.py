@@ -2,18 +2,33 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
-from xml.sax.saxutils import escape
 
 MONTHS_BY_LANGUAGE = {
-    "pt": ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"],
-    "en": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+    "pt": ("Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"),
+    "en": ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
 }
 
-TAG_MARKERS = {"<b>": "___BOLD_START___", "</b>": "___BOLD_END___", "<i>": "___ITALIC_START___", "</i>": "___ITALIC_END___", "<u>": "___UNDERLINE_START___", "</u>": "___UNDERLINE_END___"}
+# Abreviacao por representacao de mes (3, "3" e "03"), montada uma vez por idioma.
+MONTH_LABELS_BY_LANGUAGE = {
+    language: {
+        month_value: month_label
+        for month_number, month_label in enumerate(month_labels, start=1)
+        for month_value in (month_number, str(month_number), f"{month_number:02d}")
+    }
+    for language, month_labels in MONTHS_BY_LANGUAGE.items()
+}
 
+# Chaves que identificam um dicionario de variantes por idioma ({"pt": ..., "en": ...}).
+LANGUAGE_VARIANT_KEYS = frozenset(("pt", "en", "default"))
 FILENAME_SANITIZATION_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
 XML_ESCAPE_ENTITIES = {"'": "&apos;", '"': "&quot;"}
+XML_ESCAPE_REPLACEMENTS = {"&": "&amp;", "<": "&lt;", ">": "&gt;", **XML_ESCAPE_ENTITIES}
+# Tabela unica de escape XML: um `str.translate` substitui as passagens encadeadas de `replace`.
+XML_ESCAPE_TABLE = str.maketrans(XML_ESCAPE_REPLACEMENTS)
+# Casa tags de formatacao permitidas (<b>, <i>, <u>) ou caracteres especiais XML em uma unica passada.
+RICH_TEXT_TOKEN_PATTERN = re.compile(r"</?[biu]>|[&<>\"']")
 
 
 # Busca traducao aceitando schema antigo e novo, com fallback seguro para valor default.
@@ -50,8 +65,9 @@ def get_localized_field(data: Any, field_name: str, language: str, default: str
         resolved_value = _select_language_variant(field_value, language)
         return _normalize_string(resolved_value, default)
 
-    localized_value = data.get(f"{field_name}_{language}")
-    portuguese_fallback = data.get(f"{field_name}_pt") if language != "pt" else None
+    localized_key, portuguese_key = _localized_field_keys(field_name, language)
+    localized_value = data.get(localized_key)
+    portuguese_fallback = data.get(portuguese_key) if portuguese_key else None
     neutral_fallback = field_value
 
     resolved_value = localized_value or portuguese_fallback or neutral_fallback or ""
@@ -69,10 +85,11 @@ def get_localized_list(data: Any, field_name: str, language: str) -> list[str]:
         if isinstance(selected_list, list):
             return [str(item) for item in selected_list]
 
+    localized_key, portuguese_key = _localized_field_keys(field_name, language)
     legacy_values = (
-        data.get(f"{field_name}_{language}")
-        or (data.get(f"{field_name}_pt") if language != "pt" else None)
-        or data.get(field_name)
+        data.get(localized_key)
+        or (data.get(portuguese_key) if portuguese_key else None)
+        or field_value
         or []
     )
     if not isinstance(legacy_values, list):
@@ -84,23 +101,15 @@ def get_localized_list(data: Any, field_name: str, language: str) -> list[str]:
 # Escapa entidades XML sem remover tags de formatacao permitidas (<b>, <i>, <u>).
 def escape_text_preserving_tags(raw_text: Any) -> str:
     text = str(raw_text)
-
-    # Usa marcadores temporários para preservar apenas as tags permitidas.
-    protected_text = text
-    for tag, marker in TAG_MARKERS.items():
-        protected_text = protected_text.replace(tag, marker)
-
-    escaped_text = escape(protected_text, XML_ESCAPE_ENTITIES)
-
-    for tag, marker in TAG_MARKERS.items():
-        escaped_text = escaped_text.replace(marker, tag)
-
-    return escaped_text
+    # Sem "<" não há tag a preservar: a tabela de `str.translate` escapa tudo em uma passada em C.
+    if "<" not in text:
+        return _escape_xml(text)
+    return _escape_tagged_text(text)
 
 
 # Escapa conteudo para atributos XML, incluindo aspas simples e duplas.
 def escape_xml_attribute(raw_value: Any) -> str:
-    return escape(str(raw_value), XML_ESCAPE_ENTITIES)
+    return _escape_xml(str(raw_value))
 
 
 # Prepara texto rico para Paragraph convertendo quebras de linha em <br/>.
@@ -110,16 +119,28 @@ def process_rich_text(raw_text: Any) -> str:
 
 # Converte mes numerico para abreviacao local, mantendo valor original quando invalido.
 def format_month(raw_month: Any, language: str) -> str:
-    try:
+    month_labels = MONTH_LABELS_BY_LANGUAGE.get(language, MONTH_LABELS_BY_LANGUAGE["pt"])
+    # Formatos usuais ("3", "03", 3) resolvem com uma unica consulta ao dicionario.
+    if isinstance(raw_month, (str, int)):
+        month_label = month_labels.get(raw_month)
+        if month_label is not None:
+            return month_label
+
+    # Demais formatos numericos (ex.: " 3") seguem a conversao; `isdecimal` evita excecao no caso comum.
+    if isinstance(raw_month, int):
+        month_number = raw_month
+    elif isinstance(raw_month, str) and raw_month.isdecimal():
         month_number = int(raw_month)
-    except (TypeError, ValueError):
-        return str(raw_month)
+    else:
+        try:
+            month_number = int(raw_month)
+        except (TypeError, ValueError):
+            return str(raw_month)
 
     if not 1 <= month_number <= 12:
         return str(raw_month)
 
-    months = MONTHS_BY_LANGUAGE.get(language, MONTHS_BY_LANGUAGE["pt"])
-    return months[month_number - 1]
+    return month_labels[month_number]
 
 
 # Monta periodo de inicio/fim usando traducao de "atual" quando nao houver data final.
@@ -131,6 +152,36 @@ def format_period(
     end_year: Any,
     translations: dict[str, Any],
     language: str,
+    current_label: str | None = None,
+) -> str:
+    # Rotulo pode vir pre-resolvido por quem formata varios periodos no mesmo idioma.
+    if current_label is None and not (end_month and end_year):
+        current_label = get_translation(translations, language, "labels", "current", "Present")
+
+    period_arguments = (start_month, start_year, end_month, end_year, language, current_label)
+    try:
+        return _format_period_text(*period_arguments)
+    except TypeError:
+        # Valores nao hasheaveis (ex.: listas no JSON) nao entram no cache.
+        return _format_period_text.__wrapped__(*period_arguments)
+
+
+# Limpa componente de nome de arquivo removendo caracteres inseguros.
+def sanitize_filename_component(raw_value: Any, fallback: str = "CV") -> str:
+    escaped_value = FILENAME_SANITIZATION_PATTERN.sub("_", str(raw_value).strip())
+    normalized_value = escaped_value.strip("._-")
+    return normalized_value or fallback
+
+
+# Formata periodo com rotulo "atual" ja resolvido; `typed` evita confundir 1 e True no cache.
+@lru_cache(maxsize=512, typed=True)
+def _format_period_text(
+    start_month: Any,
+    start_year: Any,
+    end_month: Any,
+    end_year: Any,
+    language: str,
+    current_label: str | None,
 ) -> str:
     initial_month = format_month(start_month, language)
     start_period = f"{initial_month} {start_year}".strip()
@@ -139,21 +190,40 @@ def format_period(
         final_month = format_month(end_month, language)
         return f"{start_period} - {final_month} {end_year}".strip()
 
-    current_label = get_translation(translations, language, "labels", "current", "Present")
     return f"{start_period} - {current_label}".strip()
 
 
-# Limpa componente de nome de arquivo removendo caracteres inseguros.
-def sanitize_filename_component(raw_value: Any, fallback: str = "CV") -> str:
-    escaped_value = FILENAME_SANITIZATION_PATTERN.sub("_", str(raw_value).strip())
-    normalized_value = escaped_value.strip("._-")
-    return normalized_value or fallback
+# Monta chaves legadas `<campo>_<idioma>` e `<campo>_pt` uma vez por par campo/idioma (campos e listas).
+@lru_cache(maxsize=256)
+def _localized_field_keys(field_name: str, language: str) -> tuple[str, str | None]:
+    # Sem fallback portugues quando o idioma pedido ja e portugues.
+    portuguese_key = f"{field_name}_pt" if language != "pt" else None
+    return f"{field_name}_{language}", portuguese_key
+
+
+# Escapa entidades XML em uma unica passada, memoizando textos repetidos (cargos, empresas, rotulos).
+@lru_cache(maxsize=4096)
+def _escape_xml(text: str) -> str:
+    return text.translate(XML_ESCAPE_TABLE)
+
+
+# Escapa texto que contem "<" preservando tags permitidas; memoizado como o caminho sem tags.
+@lru_cache(maxsize=1024)
+def _escape_tagged_text(text: str) -> str:
+    # Tags permitidas casam no mesmo regex e são devolvidas intactas pelo callback.
+    return RICH_TEXT_TOKEN_PATTERN.sub(_replace_rich_text_token, text)
+
+
+# Troca caractere especial pela entidade XML e preserva tags de formatacao permitidas.
+def _replace_rich_text_token(match: re.Match[str]) -> str:
+    token = match.group()
+    return XML_ESCAPE_REPLACEMENTS.get(token, token)
 
 
 # Identifica dicionarios que seguem o padrao de variantes por idioma.
 def _contains_language_variants(value: dict[str, Any]) -> bool:
-    language_keys = {"pt", "en", "default"}
-    return bool(language_keys.intersection(value.keys()))
+    # `isdisjoint` para na primeira chave encontrada, sem montar conjunto de intersecao.
+    return not LANGUAGE_VARIANT_KEYS.isdisjoint(value)
 
 
 # Define criterio unico de "valor preenchido" usado nas regras de fallback.
@@ -169,13 +239,7 @@ def _is_non_empty(value: Any) -> bool:
 
 # Seleciona a melhor variante disponivel seguindo ordem de prioridade por idioma.
 def _select_language_variant(variants: dict[str, Any], language: str) -> Any:
-    # Ordem de busca prioriza idioma pedido, depois fallbacks explícitos e padrão.
-    lookup_order = [language]
-    if language != "pt":
-        lookup_order.append("pt")
-    if language != "en":
-        lookup_order.append("en")
-    lookup_order.append("default")
+    lookup_order = _language_lookup_order(language)
 
     for language_key in lookup_order:
         value = variants.get(language_key)
@@ -192,6 +256,19 @@ def _select_language_variant(variants: dict[str, Any], language: str) -> Any:
     return None
 
 
+# Calcula uma vez por idioma a ordem de busca das variantes.
+@lru_cache(maxsize=32)
+def _language_lookup_order(language: str) -> tuple[str, ...]:
+    # Ordem de busca prioriza idioma pedido, depois fallbacks explícitos e padrão.
+    lookup_order = [language]
+    if language != "pt":
+        lookup_order.append("pt")
+    if language != "en":
+        lookup_order.append("en")
+    lookup_order.append("default")
+    return tuple(lookup_order)
+
+
 # Converte qualquer valor para string limpa e aplica default quando necessario.
 def _normalize_string(value: Any, default: str) -> str:
     if value is None:
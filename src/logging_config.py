@@ -1,7 +1,12 @@
 # Configura logging estruturado e cria contexto de rastreabilidade por requisicao.
 from __future__ import annotations
 
+import multiprocessing
 import sys
+import threading
+import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -23,17 +28,36 @@ DEFAULT_LOG_EXTRA = {
     "duration_ms": "-",
 }
 
+# Ultima configuracao aplicada; repetir os mesmos parametros nao recria os sinks.
+_active_logging_settings: tuple[str, Path, Any] | None = None
+
 
 # Configura sinks de console/arquivo e padroniza campos extras para logs estruturados.
-def configure_logging(*, level: str = "INFO", enabled: bool = True, logs_directory: Path) -> None:
-    logs_directory.mkdir(parents=True, exist_ok=True)
+def configure_logging(
+    *,
+    level: str = "INFO",
+    enabled: bool = True,
+    logs_directory: Path,
+    log_queue: Any | None = None,
+) -> None:
+    global _active_logging_settings
 
     # Com logging desabilitado, mantém apenas avisos/erros para reduzir ruído.
     effective_level = level.upper() if enabled else "WARNING"
+    requested_settings = (effective_level, logs_directory, log_queue)
+    # Vários serviços no mesmo processo (lotes, workers) compartilham os sinks em vez de reabrir o arquivo de log.
+    if requested_settings == _active_logging_settings:
+        return
 
     logger.remove()
     logger.configure(extra=DEFAULT_LOG_EXTRA)
 
+    # Workers de lote so encaminham registros ao pai, que e o unico a escrever no console e em `cv_generator.log`.
+    if log_queue is not None:
+        logger.add(_build_queue_sink(log_queue), level=effective_level, format="{message}")
+        _active_logging_settings = requested_settings
+        return
+
     logger.add(
         sys.stderr,
         level=effective_level,
@@ -42,6 +66,7 @@ def configure_logging(*, level: str = "INFO", enabled: bool = True, logs_directo
         backtrace=True,
         diagnose=False,
     )
+    logs_directory.mkdir(parents=True, exist_ok=True)
     logger.add(
         logs_directory / "cv_generator.log",
         level=effective_level,
@@ -51,6 +76,51 @@ def configure_logging(*, level: str = "INFO", enabled: bool = True, logs_directo
         backtrace=True,
         diagnose=False,
     )
+    _active_logging_settings = requested_settings
+
+
+# Abre uma fila para workers de lote e reemite seus registros nos sinks deste processo enquanto o contexto durar.
+@contextmanager
+def forward_worker_logs() -> Iterator[Any]:
+    log_queue = multiprocessing.get_context().Queue()
+    listener = threading.Thread(target=_emit_worker_records, args=(log_queue,), daemon=True)
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        # Chamado apos o encerramento do pool: os registros dos workers ja estao na fila antes do sentinela.
+        log_queue.put(None)
+        listener.join()
+        log_queue.close()
+        log_queue.join_thread()
+
+
+# Serializa o registro do worker em uma tupla simples; traceback vira texto porque frames nao sao picklable.
+def _build_queue_sink(log_queue: Any) -> Callable[[Any], None]:
+    def forward_record(message: Any) -> None:
+        record = message.record
+        exception_text = ""
+        if record["exception"] is not None:
+            exception_text = "".join(traceback.format_exception(*record["exception"])).rstrip()
+        log_queue.put(
+            (record["level"].name, record["time"], dict(record["extra"]), record["message"], exception_text)
+        )
+
+    return forward_record
+
+
+# Consome a fila ate o sentinela, preservando nivel, horario original e campos extras de cada registro.
+def _emit_worker_records(log_queue: Any) -> None:
+    while True:
+        worker_record = log_queue.get()
+        if worker_record is None:
+            return
+        level_name, record_time, extra, record_message, exception_text = worker_record
+        if exception_text:
+            record_message = f"{record_message}\n{exception_text}"
+        logger.patch(lambda record, record_time=record_time: record.update(time=record_time)).bind(**extra).log(
+            level_name, record_message
+        )
 
 
 # Anexa metadados da requisicao ao logger para correlacionar eventos do pipeline.
@@ -6,26 +6,26 @@ from typing import Any
 from exceptions import DataValidationError
 
 
-REQUIRED_TOP_LEVEL_FIELDS = ["personal_info", "desired_role"]
-REQUIRED_PERSONAL_INFO_FIELDS = ["name", "email"]
+REQUIRED_TOP_LEVEL_FIELDS = ("personal_info", "desired_role")
+REQUIRED_PERSONAL_INFO_FIELDS = ("name", "email")
 
 
 # Valida campos minimos exigidos pelo gerador e acumula erros para feedback completo.
 def validate_cv_data(cv_data: dict[str, Any]) -> None:
-    validation_errors: list[str] = []
-
     # Acumula todos os problemas para retornar feedback completo em uma única falha.
-    for required_field in REQUIRED_TOP_LEVEL_FIELDS:
-        if required_field not in cv_data:
-            validation_errors.append(f"Missing top-level field: '{required_field}'")
+    validation_errors = [
+        f"Missing top-level field: '{required_field}'"
+        for required_field in REQUIRED_TOP_LEVEL_FIELDS
+        if required_field not in cv_data
+    ]
 
     personal_info = cv_data.get("personal_info", {})
     if isinstance(personal_info, dict):
-        for required_personal_field in REQUIRED_PERSONAL_INFO_FIELDS:
-            if not personal_info.get(required_personal_field):
-                validation_errors.append(
-                    f"Missing required field: 'personal_info.{required_personal_field}'"
-                )
+        validation_errors.extend(
+            f"Missing required field: 'personal_info.{required_personal_field}'"
+            for required_personal_field in REQUIRED_PERSONAL_INFO_FIELDS
+            if not personal_info.get(required_personal_field)
+        )
     else:
         validation_errors.append("Field 'personal_info' must be a dictionary")
 
@@ -5,7 +5,9 @@ from pathlib import Path
 
 import pytest
 
-from cv_service import CvGenerationService
+import cv_service
+from cv_service import CvGenerationService, GenerationRequest, run_generation_batch
+from exceptions import BatchGenerationError, PdfRenderError
 from tests.helpers.project_builders import create_test_project_files
 
 
@@ -120,3 +122,117 @@ def test_cv_generation_service_respects_output_override(
 
     assert generated_file_path == custom_output_path.resolve()
     assert generated_file_path.exists()
+
+
+# Garante o comportamento "generate many reuses renderer per language" para evitar regressao dessa regra.
+def test_cv_generation_service_generates_many_pdfs_reusing_renderer(
+    isolated_project_files: Path,
+) -> None:
+    generation_service = CvGenerationService(config_file_path=isolated_project_files)
+    output_directory = isolated_project_files.parent / "output"
+
+    generated_file_paths = generation_service.generate_many(
+        [
+            GenerationRequest(language="pt", output_file_path=str(output_directory / "first.pdf")),
+            GenerationRequest(language="pt", output_file_path=str(output_directory / "second.pdf")),
+            GenerationRequest(language="en"),
+        ]
+    )
+
+    assert [path.name for path in generated_file_paths[:2]] == ["first.pdf", "second.pdf"]
+    assert generated_file_paths[2].name.endswith("_EN.pdf")
+    assert all(path.exists() for path in generated_file_paths)
+    # Um renderizador por idioma: o segundo PDF em português reaproveita o primeiro.
+    assert len(generation_service._pdf_renderers) == 2
+
+
+# Garante o comportamento "run generation batch renders in worker processes" para evitar regressao dessa regra.
+def test_run_generation_batch_renders_in_worker_processes(
+    isolated_project_files: Path,
+) -> None:
+    output_directory = isolated_project_files.parent / "output"
+
+    generated_file_paths = run_generation_batch(
+        config_file_path=isolated_project_files,
+        generation_requests=[
+            GenerationRequest(language="pt", output_file_path=str(output_directory / "pt.pdf")),
+            GenerationRequest(language="en", output_file_path=str(output_directory / "en.pdf")),
+        ],
+        max_workers=2,
+    )
+
+    assert generated_file_paths == [
+        (output_directory / "pt.pdf").resolve(),
+        (output_directory / "en.pdf").resolve(),
+    ]
+    assert all(path.stat().st_size > 1000 for path in generated_file_paths)
+
+
+# Garante o comportamento "generate many keeps outputs on unexpected failure" para evitar regressao dessa regra.
+def test_generate_many_keeps_outputs_on_unexpected_failure(
+    isolated_project_files: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generation_service = CvGenerationService(config_file_path=isolated_project_files)
+    original_generate = generation_service.generate
+
+    # Simula falha fora do dominio (ex.: erro interno do ReportLab) apenas para o CV em inglês.
+    def generate_failing_in_english(**generation_arguments: object) -> Path:
+        if generation_arguments["language"] == "en":
+            raise RuntimeError("layout exploded")
+        return original_generate(**generation_arguments)
+
+    monkeypatch.setattr(generation_service, "generate", generate_failing_in_english)
+
+    with pytest.raises(BatchGenerationError) as raised_error:
+        generation_service.generate_many([GenerationRequest(language="pt"), GenerationRequest(language="en")])
+
+    assert [path.name for path in raised_error.value.generated_files] == [
+        "Maria_Testadora_Desenvolvedora_Frontend.pdf"
+    ]
+    [(failure_label, failure_error)] = raised_error.value.failures
+    assert failure_label == "default input [en]"
+    assert isinstance(failure_error, PdfRenderError)
+    assert isinstance(failure_error.__cause__, RuntimeError)
+
+
+# Garante o comportamento "run generation batch logs worker events in parent file" para evitar regressao dessa regra.
+def test_run_generation_batch_logs_worker_events_in_parent_file(
+    isolated_project_files: Path,
+) -> None:
+    output_directory = isolated_project_files.parent / "output"
+
+    run_generation_batch(
+        config_file_path=isolated_project_files,
+        generation_requests=[
+            GenerationRequest(language="pt", output_file_path=str(output_directory / "pt.pdf")),
+            GenerationRequest(language="en", output_file_path=str(output_directory / "en.pdf")),
+        ],
+        max_workers=2,
+    )
+
+    log_file_path = isolated_project_files.parent.parent / "logs" / "cv_generator.log"
+    log_lines = log_file_path.read_text(encoding="utf-8").splitlines()
+    # Eventos por CV gerados nos workers chegam ao arquivo do pai, junto do resumo do lote.
+    assert sum(" | app_start | " in line for line in log_lines) == 2
+    assert sum(" | pdf_build_finished | " in line for line in log_lines) == 2
+    assert any("language=en" in line for line in log_lines)
+    assert "Generated 2 files with 2 workers" in log_lines[-1]
+
+
+# Garante o comportamento "run generation batch keeps small batches in process" para evitar regressao dessa regra.
+def test_run_generation_batch_keeps_small_batches_in_process(
+    isolated_project_files: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cv_service, "ProcessPoolExecutor", None)
+
+    generated_file_paths = run_generation_batch(
+        config_file_path=isolated_project_files,
+        generation_requests=[GenerationRequest(language="pt"), GenerationRequest(language="en")],
+    )
+
+    assert [path.name for path in generated_file_paths] == [
+        "Maria_Testadora_Desenvolvedora_Frontend.pdf",
+        "Maria_Testadora_Frontend_Developer_EN.pdf",
+    ]
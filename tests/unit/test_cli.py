@@ -1,9 +1,15 @@
 # Verifica contratos de saida da CLI para sucesso e falhas de configuracao.
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
-from cli import main
+import pytest
+
+from cli import build_argument_parser, default_config_file_path, main
+from tests.helpers.file_helpers import write_json
 from tests.helpers.project_builders import create_test_project_files
 
 
@@ -38,3 +44,124 @@ def test_cli_main_returns_one_for_invalid_config_path() -> None:
     exit_code = main(["-c", "missing-config-file.json"])
 
     assert exit_code == 1
+
+
+# Garante o comportamento "cli resolves default config only when not provided" para evitar regressao dessa regra.
+def test_cli_resolves_default_config_only_when_not_provided() -> None:
+    arguments = build_argument_parser().parse_args([])
+
+    assert arguments.config is None
+    assert default_config_file_path() == Path(__file__).resolve().parents[2] / "config" / "config.json"
+
+
+# Garante o comportamento "cli main generates multiple inputs in batch" para evitar regressao dessa regra.
+def test_cli_main_generates_multiple_inputs_in_batch(tmp_path: Path) -> None:
+    config_path = _create_valid_project_files(tmp_path)
+    input_paths = []
+    for candidate_name in ("First Candidate", "Second Candidate"):
+        input_path = tmp_path / "data" / f"{candidate_name.split()[0].lower()}.json"
+        write_json(
+            input_path,
+            {
+                "personal_info": {"name": candidate_name, "email": "cli@example.com"},
+                "desired_role": {"desired_role_pt": "Desenvolvedor"},
+            },
+        )
+        input_paths.append(str(input_path))
+
+    exit_code = main([*input_paths, "-c", str(config_path), "-l", "pt"])
+
+    assert exit_code == 0
+    generated_names = sorted(path.name for path in (tmp_path / "output").glob("*.pdf"))
+    assert generated_names == ["First_Candidate_Desenvolvedor.pdf", "Second_Candidate_Desenvolvedor.pdf"]
+
+
+# Garante o comportamento "cli batch keeps valid outputs when one input fails" para evitar regressao dessa regra.
+def test_cli_batch_keeps_valid_outputs_when_one_input_fails(tmp_path: Path) -> None:
+    config_path = _create_valid_project_files(tmp_path)
+    valid_input_path = tmp_path / "data" / "valid.json"
+    write_json(
+        valid_input_path,
+        {
+            "personal_info": {"name": "Valid Candidate", "email": "cli@example.com"},
+            "desired_role": {"desired_role_pt": "Desenvolvedor"},
+        },
+    )
+
+    missing_input_path = tmp_path / "data" / "missing.json"
+
+    exit_code = main([str(missing_input_path), str(valid_input_path), "-c", str(config_path), "-j", "1"])
+
+    assert exit_code == 1
+    generated_names = [path.name for path in (tmp_path / "output").glob("*.pdf")]
+    assert generated_names == ["Valid_Candidate_Desenvolvedor.pdf"]
+
+
+# Garante o comportamento "cli main generates each requested language" para evitar regressao dessa regra.
+def test_cli_main_generates_each_requested_language(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    config_path = _create_valid_project_files(tmp_path)
+
+    exit_code = main(["-c", str(config_path), "-l", "pt,en", "-j", "1"])
+
+    assert exit_code == 0
+    generated_names = sorted(path.name for path in (tmp_path / "output").glob("*.pdf"))
+    assert generated_names == ["CLI_Test_Desenvolvedor.pdf", "CLI_Test_Desenvolvedor_EN.pdf"]
+    success_lines = capsys.readouterr().out.splitlines()
+    assert [Path(line).name for line in success_lines] == generated_names
+
+
+# Garante o comportamento "cli rejects unknown language in list" para evitar regressao dessa regra.
+def test_cli_rejects_unknown_language_in_list() -> None:
+    parser = build_argument_parser()
+
+    assert parser.parse_args(["-l", "EN, pt,en"]).language == ["en", "pt"]
+    with pytest.raises(SystemExit):
+        parser.parse_args(["-l", "pt,fr"])
+    with pytest.raises(SystemExit):
+        main(["-l", "pt,en", "-o", "cv.pdf"])
+
+
+# Garante o comportamento "cli rejects output override with multiple inputs" para evitar regressao dessa regra.
+def test_cli_rejects_output_override_with_multiple_inputs() -> None:
+    with pytest.raises(SystemExit) as raised_exit:
+        main(["first.json", "second.json", "-o", "cv.pdf"])
+
+    assert raised_exit.value.code == 2
+
+
+# Garante o comportamento "cli rejects non positive worker count" para evitar regressao dessa regra.
+def test_cli_rejects_non_positive_worker_count() -> None:
+    parser = build_argument_parser()
+
+    assert parser.parse_args(["-j", "3"]).workers == 3
+    for invalid_value in ("0", "-1", "many"):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["-j", invalid_value])
+
+
+# Garante o comportamento "cli import does not load reportlab" para evitar regressao dessa regra.
+def test_cli_import_does_not_load_reportlab() -> None:
+    probe = "import sys, cli; print('reportlab' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+
+    assert completed.stdout.strip() == "False"
+
+
+# Garante o comportamento "cv service import does not load reportlab" para evitar regressao dessa regra.
+def test_cv_service_import_does_not_load_reportlab() -> None:
+    probe = "import sys, cv_service; print('reportlab' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+
+    assert completed.stdout.strip() == "False"
@@ -0,0 +1,106 @@
+# Verifica leitura tipada do config.json e o cache de configuracao por arquivo.
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from exceptions import ConfigurationError
+from infrastructure import config_loader
+from infrastructure.config_loader import load_app_config
+from tests.helpers.file_helpers import write_json
+from tests.helpers.project_builders import build_default_app_config
+
+
+# Garante o comportamento "load app config reuses parsed config for unchanged file" para evitar regressao dessa regra.
+def test_load_app_config_reuses_parsed_config_for_unchanged_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    write_json(config_path, build_default_app_config())
+
+    first_config = load_app_config(config_path)
+    second_config = load_app_config(config_path)
+
+    assert first_config is second_config
+    assert first_config.defaults.language == "pt"
+
+
+# Garante o comportamento "load app config evicts least recently used configs" para evitar regressao dessa regra.
+def test_load_app_config_evicts_least_recently_used_configs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config_loader, "APP_CONFIG_CACHE_SIZE", 1)
+    first_path = tmp_path / "first.json"
+    second_path = tmp_path / "second.json"
+    write_json(first_path, build_default_app_config())
+    write_json(second_path, build_default_app_config())
+
+    first_config = load_app_config(first_path)
+    second_config = load_app_config(second_path)
+
+    assert load_app_config(second_path) is second_config
+    assert load_app_config(first_path) is not first_config
+
+
+# Garante o comportamento "load app config reloads changed file" para evitar regressao dessa regra.
+def test_load_app_config_reloads_changed_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    app_config = build_default_app_config()
+    write_json(config_path, app_config)
+    first_config = load_app_config(config_path)
+
+    app_config["defaults"]["language"] = "english"
+    write_json(config_path, app_config)
+    reloaded_config = load_app_config(config_path)
+
+    assert first_config.defaults.language == "pt"
+    assert reloaded_config.defaults.language == "english"
+
+
+# Garante o comportamento "load app config rejects missing file" para evitar regressao dessa regra.
+def test_load_app_config_rejects_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(ConfigurationError) as raised_error:
+        load_app_config(tmp_path / "missing.json")
+
+    assert "Configuration file not found" in str(raised_error.value)
+
+
+# Garante o comportamento "load app config rejects invalid json" para evitar regressao dessa regra.
+def test_load_app_config_rejects_invalid_json(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(b'{"files": ')
+
+    with pytest.raises(ConfigurationError) as raised_error:
+        load_app_config(config_path)
+
+    assert "Configuration file has invalid JSON" in str(raised_error.value)
+
+
+# Garante o comportamento "load app config rejects non object sections" para evitar regressao dessa regra.
+@pytest.mark.parametrize(
+    ("raw_config", "expected_message"),
+    [
+        ([], "Configuration root must be a JSON object"),
+        ({**build_default_app_config(), "logging": "INFO"}, "Section 'logging' must be a dictionary"),
+    ],
+)
+def test_load_app_config_rejects_non_object_sections(
+    tmp_path: Path,
+    raw_config: object,
+    expected_message: str,
+) -> None:
+    config_path = tmp_path / "config.json"
+    write_json(config_path, raw_config)
+
+    with pytest.raises(ConfigurationError) as raised_error:
+        load_app_config(config_path)
+
+    assert expected_message in str(raised_error.value)
+
+
+# Garante o comportamento "load app config returns slotted settings" para evitar regressao dessa regra.
+def test_load_app_config_returns_slotted_settings(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    write_json(config_path, build_default_app_config())
+
+    app_config = load_app_config(config_path)
+
+    for settings in (app_config, app_config.files, app_config.defaults, app_config.logging):
+        assert not hasattr(settings, "__dict__")
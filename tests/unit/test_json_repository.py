@@ -0,0 +1,107 @@
+# Verifica leitura de JSON com parser rapido opcional e traducao de erros para o dominio.
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from exceptions import JsonFileNotFoundError, JsonParsingError
+from infrastructure import json_repository
+from infrastructure.json_repository import load_json
+from tests.helpers.file_helpers import write_json
+
+
+# Garante o comportamento "load json reads dictionary with unicode content" para evitar regressao dessa regra.
+def test_load_json_reads_dictionary_with_unicode_content(tmp_path: Path) -> None:
+    json_path = tmp_path / "cv_data.json"
+    write_json(json_path, {"name": "João", "items": [1, 2]})
+
+    assert load_json(json_path) == {"name": "João", "items": [1, 2]}
+
+
+# Garante o comportamento "load json falls back to stdlib parser" para evitar regressao dessa regra.
+def test_load_json_falls_back_to_stdlib_parser(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_repository, "orjson", None)
+    json_path = tmp_path / "cv_data.json"
+    write_json(json_path, {"name": "João"})
+
+    assert load_json(json_path) == {"name": "João"}
+
+
+# Garante o comportamento "load json supports non utf8 encoding" para evitar regressao dessa regra.
+def test_load_json_supports_non_utf8_encoding(tmp_path: Path) -> None:
+    json_path = tmp_path / "cv_data.json"
+    json_path.write_text('{"name": "João"}', encoding="latin-1")
+
+    assert load_json(json_path, encoding="latin-1") == {"name": "João"}
+
+
+# Garante o comportamento "load json raises domain errors" para evitar regressao dessa regra.
+def test_load_json_raises_domain_errors(tmp_path: Path) -> None:
+    invalid_json_path = tmp_path / "invalid.json"
+    invalid_json_path.write_text("{invalid", encoding="utf-8")
+    list_json_path = tmp_path / "list.json"
+    list_json_path.write_text("[1, 2]", encoding="utf-8")
+
+    with pytest.raises(JsonFileNotFoundError):
+        load_json(tmp_path / "missing.json")
+    with pytest.raises(JsonParsingError):
+        load_json(invalid_json_path)
+    with pytest.raises(JsonParsingError):
+        load_json(list_json_path)
+
+
+# Garante o comportamento "load json memory maps large files" para evitar regressao dessa regra.
+def test_load_json_memory_maps_large_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_repository, "MMAP_THRESHOLD_BYTES", 0)
+    json_path = tmp_path / "cv_data.json"
+    write_json(json_path, {"name": "João"})
+    invalid_json_path = tmp_path / "invalid.json"
+    invalid_json_path.write_text("{invalid", encoding="utf-8")
+
+    assert load_json(json_path) == {"name": "João"}
+    with pytest.raises(JsonParsingError):
+        load_json(invalid_json_path)
+
+
+# Garante o comportamento "load json reuses bytes until file changes" para evitar regressao dessa regra.
+def test_load_json_reuses_bytes_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    json_path = tmp_path / "cv_data.json"
+    write_json(json_path, {"name": "João"})
+    first_document = load_json(json_path)
+
+    # Com o arquivo inalterado, a segunda leitura vem do cache sem reabrir o arquivo.
+    original_read_json_bytes = json_repository._read_json_bytes
+    monkeypatch.setattr(json_repository, "_read_json_bytes", pytest.fail)
+    assert load_json(json_path) == {"name": "João"}
+
+    monkeypatch.setattr(json_repository, "_read_json_bytes", original_read_json_bytes)
+    write_json(json_path, {"name": "Maria Silva"})
+    assert load_json(json_path) == {"name": "Maria Silva"}
+    assert first_document == {"name": "João"}
+
+
+# Garante o comportamento "load json returns independent documents" para evitar regressao dessa regra.
+def test_load_json_returns_independent_documents(tmp_path: Path) -> None:
+    json_path = tmp_path / "cv_data.json"
+    write_json(json_path, {"name": "João", "items": [1]})
+
+    first_document = load_json(json_path)
+    first_document["items"].append(2)
+
+    assert load_json(json_path) == {"name": "João", "items": [1]}
+
+
+# Garante o comportamento "load json evicts least recently used documents" para evitar regressao dessa regra.
+def test_load_json_evicts_least_recently_used_documents(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_repository, "JSON_DOCUMENT_CACHE_SIZE", 1)
+    first_path = tmp_path / "first.json"
+    second_path = tmp_path / "second.json"
+    write_json(first_path, {"name": "First"})
+    write_json(second_path, {"name": "Second"})
+
+    load_json(first_path)
+    load_json(second_path)
+
+    cached_paths = [cached_path for cached_path, _ in json_repository._JSON_DOCUMENT_CACHE]
+    assert cached_paths == [second_path.resolve()]
@@ -2,6 +2,7 @@
 from localization import (
     escape_xml_attribute,
     escape_text_preserving_tags,
+    format_month,
     format_period,
     get_localized_field,
     get_localized_list,
@@ -64,6 +65,20 @@ def test_escape_text_preserves_supported_tags() -> None:
     assert "&amp;" in escaped_text
 
 
+# Garante o comportamento "escape text escapes unsupported tags and quotes" para evitar regressao dessa regra.
+def test_escape_text_escapes_unsupported_tags_and_quotes() -> None:
+    escaped_text = escape_text_preserving_tags('<u>A</u> <script>"x"</script> <B>')
+
+    assert escaped_text == "<u>A</u> &lt;script&gt;&quot;x&quot;&lt;/script&gt; &lt;B&gt;"
+
+
+# Garante o comportamento "escape text without tags escapes all entities" para evitar regressao dessa regra.
+def test_escape_text_without_tags_escapes_all_entities() -> None:
+    assert escape_text_preserving_tags("R&D \"core\" team's > 10") == (
+        "R&amp;D &quot;core&quot; team&apos;s &gt; 10"
+    )
+
+
 # Garante o comportamento "escape xml attribute escapes quotes" para evitar regressao dessa regra.
 def test_escape_xml_attribute_escapes_quotes() -> None:
     escaped_attribute = escape_xml_attribute('https://example.com?q="x"&tag=\'y\'')
@@ -73,6 +88,23 @@ def test_escape_xml_attribute_escapes_quotes() -> None:
     assert "&amp;" in escaped_attribute
 
 
+# Garante o comportamento "escape xml attribute escapes all entities in single pass" para evitar regressao dessa regra.
+def test_escape_xml_attribute_escapes_all_entities_in_single_pass() -> None:
+    escaped_attribute = escape_xml_attribute("a&b<c>d\"e'f&amp;")
+
+    assert escaped_attribute == "a&amp;b&lt;c&gt;d&quot;e&apos;f&amp;amp;"
+
+
+# Garante o comportamento "format month accepts numbers and keeps invalid values" para evitar regressao dessa regra.
+def test_format_month_accepts_numbers_and_keeps_invalid_values() -> None:
+    assert format_month("03", "en") == "Mar"
+    assert format_month(12, "pt") == "Dez"
+    assert format_month(" 2 ", "pt") == "Fev"
+    assert format_month("13", "en") == "13"
+    assert format_month("abc", "en") == "abc"
+    assert format_month("", "en") == ""
+
+
 # Garante o comportamento "format period uses present label when missing end date" para evitar regressao dessa regra.
 def test_format_period_uses_present_label_when_missing_end_date() -> None:
     translations = {
@@ -96,6 +128,20 @@ def test_format_period_uses_present_label_when_missing_end_date() -> None:
     assert period_text == "Jan 2022 - Present"
 
 
+# Garante o comportamento "format period handles unhashable values" para evitar regressao dessa regra.
+def test_format_period_handles_unhashable_values() -> None:
+    period_text = format_period(
+        start_month=["1"],
+        start_year="2020",
+        end_month="2",
+        end_year="2021",
+        translations={},
+        language="en",
+    )
+
+    assert period_text == "['1'] 2020 - Feb 2021"
+
+
 # Garante o comportamento "get translation supports unified language map" para evitar regressao dessa regra.
 def test_get_translation_supports_unified_language_map() -> None:
     translations = {
@@ -0,0 +1,23 @@
+# Verifica a configuracao dos sinks de log compartilhados pelo processo.
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import logging_config
+from logging_config import configure_logging
+
+
+# Garante o comportamento "configure logging skips repeated identical setup" para evitar regressao dessa regra.
+def test_configure_logging_skips_repeated_identical_setup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    logger_spy = MagicMock()
+    monkeypatch.setattr(logging_config, "logger", logger_spy)
+    monkeypatch.setattr(logging_config, "_active_logging_settings", None)
+
+    configure_logging(level="info", logs_directory=tmp_path)
+    configure_logging(level="INFO", logs_directory=tmp_path)
+    configure_logging(level="DEBUG", logs_directory=tmp_path)
+
+    assert logger_spy.remove.call_count == 2
@@ -1,8 +1,12 @@
 # Garante comportamento do renderizador ao montar secoes dinamicas e tratar tipos invalidos.
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
+import pytest
+
+from exceptions import PdfRenderError
 from infrastructure.pdf_renderer import CvPdfRenderer
 from tests.helpers.style_helpers import load_project_style_configuration
 
@@ -77,3 +81,103 @@ def test_renderer_resolves_section_order_from_configuration() -> None:
     section_order = renderer._resolve_sections_to_render(cv_data)
 
     assert section_order == ["experience", "education", "skills"]
+
+
+# Garante o comportamento "renderer wraps output write failures" para evitar regressao dessa regra.
+def test_renderer_wraps_output_write_failures(tmp_path: Path) -> None:
+    renderer = CvPdfRenderer(
+        language="pt",
+        translations={},
+        visual_settings=load_project_style_configuration(),
+    )
+    # Um diretório no caminho de saída faz a escrita final falhar.
+    output_path = tmp_path / "cv.pdf"
+    output_path.mkdir()
+
+    with pytest.raises(PdfRenderError):
+        renderer.render_cv(
+            cv_data={"personal_info": {"name": "Test"}},
+            output_file_path=output_path,
+            app_logger=FakeBoundLogger(),
+        )
+    assert [path.name for path in tmp_path.iterdir()] == ["cv.pdf"]
+
+
+# Garante o comportamento "renderer writes pdf file" para evitar regressao dessa regra.
+def test_renderer_writes_pdf_file(tmp_path: Path) -> None:
+    renderer = CvPdfRenderer(
+        language="pt",
+        translations={},
+        visual_settings=load_project_style_configuration(),
+    )
+    output_path = tmp_path / "nested" / "cv.pdf"
+
+    generated_path = renderer.render_cv(
+        cv_data={"personal_info": {"name": "Test"}},
+        output_file_path=output_path,
+        app_logger=FakeBoundLogger(),
+    )
+
+    assert generated_path == output_path
+    assert output_path.read_bytes().startswith(b"%PDF")
+    assert b"/FlateDecode" in output_path.read_bytes()
+    assert [path.name for path in output_path.parent.iterdir()] == ["cv.pdf"]
+
+
+# Garante o comportamento "renderer header joins valid social links" para evitar regressao dessa regra.
+def test_renderer_header_joins_valid_social_links() -> None:
+    renderer = CvPdfRenderer(
+        language="pt",
+        translations={},
+        visual_settings=load_project_style_configuration(),
+    )
+    elements: list[Any] = []
+    cv_data = {
+        "personal_info": {
+            "social": [
+                {"label": "GitHub", "url": "https://github.com/a?x=1&y=2"},
+                {"label": "Sem URL", "url": " "},
+                "invalid",
+                {"url": "https://example.com"},
+            ]
+        }
+    }
+
+    renderer._add_header(elements, renderer.styles, cv_data)
+
+    social_paragraph = elements[0]
+    assert social_paragraph.text == (
+        '<a href="https://github.com/a?x=1&amp;y=2" color="#1f4e79">GitHub</a>'
+        ' | <a href="https://example.com" color="#1f4e79">https://example.com</a>'
+    )
+
+
+# Garante o comportamento "renderer caches translated section titles" para evitar regressao dessa regra.
+def test_renderer_caches_translated_section_titles() -> None:
+    renderer = CvPdfRenderer(
+        language="en",
+        translations={"sections": {"awards": {"pt": "Prêmios", "en": "Awards & Honors"}}},
+        visual_settings=load_project_style_configuration(),
+    )
+    elements: list[Any] = []
+
+    renderer._add_section_title(elements, renderer.styles, "awards")
+    renderer.translations["sections"]["awards"]["en"] = "Changed"
+    renderer._add_section_title(elements, renderer.styles, "awards")
+
+    assert [element.text for element in elements] == ["Awards &amp; Honors", "Awards &amp; Honors"]
+
+
+# Garante o comportamento "renderer header joins filled contact items" para evitar regressao dessa regra.
+def test_renderer_header_joins_filled_contact_items() -> None:
+    renderer = CvPdfRenderer(
+        language="en",
+        translations={},
+        visual_settings=load_project_style_configuration(),
+    )
+    elements: list[Any] = []
+    cv_data = {"personal_info": {"phone": " 11 99999-0000 ", "email": "", "location": "São Paulo"}}
+
+    renderer._add_header(elements, renderer.styles, cv_data)
+
+    assert elements[0].text == "+55 11 99999-0000 | São Paulo"
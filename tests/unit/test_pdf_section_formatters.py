@@ -65,6 +65,34 @@ def test_experience_section_formatter_renders_item(
     assert isinstance(elements[-1], Spacer)
 
 
+# Garante o comportamento "experience formatter uses translated current label" para evitar regressao dessa regra.
+def test_experience_formatter_uses_translated_current_label(
+    formatter_context: tuple[PdfStyleEngine, StyleSheet1, dict[str, Any]],
+) -> None:
+    style_engine, styles, translations = formatter_context
+    formatter = ExperienceSectionFormatter(
+        language="en",
+        translations=translations,
+        pdf_style_engine=style_engine,
+    )
+    elements: list[Any] = []
+
+    formatter.format_section_item(
+        elements,
+        styles,
+        {
+            "position": {"en": "Software Engineer"},
+            "start_month": "3",
+            "start_year": "2021",
+        },
+    )
+
+    period_paragraph = elements[1]
+    assert formatter.current_label == "Present"
+    assert isinstance(period_paragraph, Paragraph)
+    assert period_paragraph.text == "<i>Mar 2021 - Present</i>"
+
+
 # Garante o comportamento "education section formatter renders item" para evitar regressao dessa regra.
 def test_education_section_formatter_renders_item(
     formatter_context: tuple[PdfStyleEngine, StyleSheet1, dict[str, Any]],
@@ -120,6 +148,25 @@ def test_core_skills_section_formatter_renders_item(
     assert isinstance(elements[-1], Spacer)
 
 
+# Garante o comportamento "bullet descriptions share single paragraph" para evitar regressao dessa regra.
+def test_bullet_descriptions_share_single_paragraph(
+    formatter_context: tuple[PdfStyleEngine, StyleSheet1, dict[str, Any]],
+) -> None:
+    style_engine, styles, translations = formatter_context
+    formatter = CoreSkillsSectionFormatter(
+        language="pt",
+        translations=translations,
+        pdf_style_engine=style_engine,
+    )
+    elements: list[Any] = []
+
+    formatter.add_bullet_descriptions(elements, styles, ["Python & Go", "<b>APIs</b>"])
+
+    assert len(elements) == 1
+    assert isinstance(elements[0], Paragraph)
+    assert elements[0].text == "• Python &amp; Go<br/>• <b>APIs</b>"
+
+
 # Garante o comportamento "skills section formatter renders item" para evitar regressao dessa regra.
 def test_skills_section_formatter_renders_item(
     formatter_context: tuple[PdfStyleEngine, StyleSheet1, dict[str, Any]],
@@ -195,6 +242,32 @@ def test_awards_section_formatter_renders_item(
     assert isinstance(elements[0], Paragraph)
 
 
+# Garante o comportamento "inline section formatter groups items in one paragraph" para evitar regressao dessa regra.
+def test_inline_section_formatter_groups_items_in_one_paragraph(
+    formatter_context: tuple[PdfStyleEngine, StyleSheet1, dict[str, Any]],
+) -> None:
+    style_engine, styles, translations = formatter_context
+    formatter = LanguagesSectionFormatter(
+        language="pt",
+        translations=translations,
+        pdf_style_engine=style_engine,
+    )
+    elements: list[Any] = []
+
+    formatter.format_section_items(
+        elements,
+        styles,
+        [
+            {"language": {"pt": "Inglês"}, "proficiency": {"pt": "Fluente"}},
+            {"language": {"pt": ""}},
+            {"language": {"pt": "Espanhol"}},
+        ],
+    )
+
+    assert len(elements) == 1
+    assert elements[0].text == "<b>Inglês</b> - Fluente<br/>Espanhol"
+
+
 # Garante o comportamento "certifications section formatter renders item" para evitar regressao dessa regra.
 def test_certifications_section_formatter_renders_item(
     formatter_context: tuple[PdfStyleEngine, StyleSheet1, dict[str, Any]],
@@ -219,6 +292,7 @@ def test_certifications_section_formatter_renders_item(
 
     assert len(elements) == 1
     assert isinstance(elements[0], Paragraph)
+    assert elements[0].text == "<b>AWS Certified Developer</b> - Amazon (2024)"
 
 
 # Garante o comportamento "certifications section formatter ignores year when name is missing" para evitar regressao dessa regra.
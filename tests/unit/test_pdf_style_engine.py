@@ -1,11 +1,13 @@
 # Garante validacao e resolucao correta das configuracoes de estilo do PDF.
 from __future__ import annotations
 
+from collections import OrderedDict
 from copy import deepcopy
 
 import pytest
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_RIGHT
+from reportlab.lib.units import mm
 
 from infrastructure.pdf_styles import (
     PdfStyleEngine,
@@ -13,6 +15,7 @@ from infrastructure.pdf_styles import (
     resolve_social_link_color,
     validate_pdf_style_configuration,
 )
+from infrastructure.pdf_styles import pdf_style_engine
 from exceptions import PdfRenderError
 from tests.helpers.style_helpers import load_project_style_configuration
 
@@ -47,6 +50,32 @@ def test_build_pdf_stylesheet_converts_alignment_and_color() -> None:
     assert rendered_body_style.textColor == colors.toColor("#123456")
 
 
+# Garante o comportamento "build pdf stylesheet reuses parsed colors" para evitar regressao dessa regra.
+def test_build_pdf_stylesheet_reuses_parsed_colors() -> None:
+    first_configuration = deepcopy(load_project_style_configuration())
+    second_configuration = deepcopy(first_configuration)
+    first_configuration["paragraph_styles"]["BodyStyle"]["text_color"] = "#abcdef"
+    second_configuration["paragraph_styles"]["BodyStyle"]["text_color"] = "#abcdef"
+    second_configuration["paragraph_styles"]["BodyStyle"]["font_size"] = 12
+
+    first_stylesheet = build_pdf_stylesheet(first_configuration)
+    second_stylesheet = build_pdf_stylesheet(second_configuration)
+
+    assert first_stylesheet["BodyStyle"] is not second_stylesheet["BodyStyle"]
+    assert first_stylesheet["BodyStyle"].textColor is second_stylesheet["BodyStyle"].textColor
+
+
+# Garante o comportamento "build pdf stylesheet rejects unknown font" para evitar regressao dessa regra.
+def test_build_pdf_stylesheet_rejects_unknown_font() -> None:
+    mutable_style_configuration = deepcopy(load_project_style_configuration())
+    mutable_style_configuration["paragraph_styles"]["BodyStyle"]["font_name"] = "Missing-Font"
+
+    with pytest.raises(PdfRenderError) as raised_error:
+        build_pdf_stylesheet(mutable_style_configuration)
+
+    assert "Unknown paragraph style font: Missing-Font" in str(raised_error.value)
+
+
 # Garante o comportamento "pdf style engine exposes semantic style access" para evitar regressao dessa regra.
 def test_pdf_style_engine_exposes_semantic_style_access() -> None:
     style_configuration = load_project_style_configuration()
@@ -55,6 +84,7 @@ def test_pdf_style_engine_exposes_semantic_style_access() -> None:
 
     assert style_engine.margin("left") == 12.0
     assert style_engine.spacing("section_bottom") == 2.0
+    assert style_engine.spacing_points("section_bottom") == pytest.approx(2.0 * mm)
     assert style_engine.social_link_color() == "#1f4e79"
 
 
@@ -102,3 +132,43 @@ def test_pdf_style_engine_constructor_validates_configuration() -> None:
         PdfStyleEngine(mutable_style_configuration)
 
     assert "Style configuration missing required paragraph styles: NameStyle" in str(raised_error.value)
+
+
+# Garante o comportamento "build pdf stylesheet reuses cached paragraph styles" para evitar regressao dessa regra.
+def test_build_pdf_stylesheet_reuses_cached_paragraph_styles() -> None:
+    style_configuration = load_project_style_configuration()
+    changed_style_configuration = deepcopy(style_configuration)
+    changed_style_configuration["paragraph_styles"]["BodyStyle"]["font_size"] = 13
+
+    first_stylesheet = build_pdf_stylesheet(style_configuration)
+    second_stylesheet = build_pdf_stylesheet(deepcopy(style_configuration))
+    changed_stylesheet = build_pdf_stylesheet(changed_style_configuration)
+
+    assert first_stylesheet["BodyStyle"] is second_stylesheet["BodyStyle"]
+    assert changed_stylesheet["BodyStyle"].fontSize == 13
+    assert first_stylesheet["BodyStyle"].fontSize == 10
+
+
+# Garante o comportamento "build pdf stylesheet bounds paragraph style cache" para evitar regressao dessa regra.
+def test_build_pdf_stylesheet_bounds_paragraph_style_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pdf_style_engine, "PARAGRAPH_STYLE_CACHE_SIZE", 2)
+    monkeypatch.setattr(pdf_style_engine, "_PARAGRAPH_STYLE_CACHE", OrderedDict())
+
+    stylesheet = build_pdf_stylesheet(load_project_style_configuration())
+
+    assert len(pdf_style_engine._PARAGRAPH_STYLE_CACHE) == 2
+    assert stylesheet["BodyStyle"].fontSize == 10
+
+
+# Garante o comportamento "build pdf stylesheet isolates sheets sharing samples" para evitar regressao dessa regra.
+def test_build_pdf_stylesheet_isolates_sheets_sharing_sample_styles() -> None:
+    style_configuration = load_project_style_configuration()
+    renamed_style_configuration = deepcopy(style_configuration)
+    renamed_style_configuration["paragraph_styles"]["ExtraStyle"] = {"font_size": 9}
+
+    first_stylesheet = build_pdf_stylesheet(style_configuration)
+    second_stylesheet = build_pdf_stylesheet(renamed_style_configuration)
+
+    assert first_stylesheet["Normal"] is second_stylesheet["Normal"]
+    assert "ExtraStyle" in second_stylesheet
+    assert "ExtraStyle" not in first_stylesheet
@@ -9,6 +9,7 @@ from infrastructure.pdf_sections import (
     ExperienceSectionFormatter,
     build_default_section_formatter_registry,
 )
+from infrastructure.pdf_sections.registry import SECTION_FORMATTER_CLASS_BY_TYPE
 from infrastructure.pdf_styles import PdfStyleEngine
 
 
@@ -44,3 +45,17 @@ def test_registry_returns_none_for_unknown_section_type() -> None:
     formatter = registry.get_formatter("unknown_section")
 
     assert formatter is None
+
+
+# Garante o comportamento "registry formatters use slots" para evitar regressao dessa regra.
+def test_registry_formatters_use_slots() -> None:
+    style_engine = PdfStyleEngine(_load_project_style_configuration())
+    registry = build_default_section_formatter_registry(
+        language="pt",
+        translations={},
+        pdf_style_engine=style_engine,
+    )
+
+    for section_type in SECTION_FORMATTER_CLASS_BY_TYPE:
+        formatter = registry.get_formatter(section_type)
+        assert not hasattr(formatter, "__dict__")